@@ -0,0 +1,51 @@
+# Compares the spatial hash against pygame's brute-force groupcollide at
+# increasing enemy vs bullet counts. The last column is the path
+# spatial.groupcollide picks at that size (COLLISION_HASH_MIN_PAIRS).
+#   python benchmarks/bench_collisions.py
+import os
+import sys
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLLISION_HASH_MIN_PAIRS
+from game import spatial
+
+COUNTS = [8, 25, 50, 100, 200, 400, 800]
+BULLETS_PER_ENEMY = 4
+REPEATS = 20
+
+def make_group(count, w, h):
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        s = pygame.sprite.Sprite()
+        s.rect = pygame.Rect(random.randint(0, SCREEN_WIDTH - w), random.randint(0, SCREEN_HEIGHT - h), w, h)
+        group.add(s)
+    return group
+
+def time_call(fn, *args):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = fn(*args)
+    return (time.perf_counter() - start) / REPEATS * 1000.0, result
+
+def main():
+    random.seed(1234)
+    print(f"{'enemies':>8} {'bullets':>8} {'brute ms':>10} {'hash ms':>10} {'speedup':>8} {'uses':>6}")
+    for n in COUNTS:
+        enemies = make_group(n, 44, 40)
+        bullets = make_group(n * BULLETS_PER_ENEMY, 8, 20)
+
+        brute_ms, expected = time_call(pygame.sprite.groupcollide, enemies, bullets, False, False)
+        hash_ms, actual = time_call(spatial.hashed_groupcollide, enemies, bullets, False, False)
+
+        if list(expected.items()) != list(actual.items()):
+            print(f"Result mismatch at {n} enemies")
+            sys.exit(1)
+        uses = "hash" if n * n * BULLETS_PER_ENEMY >= COLLISION_HASH_MIN_PAIRS else "brute"
+        print(f"{n:>8} {n * BULLETS_PER_ENEMY:>8} {brute_ms:>10.3f} {hash_ms:>10.3f} {brute_ms / hash_ms:>7.2f}x {uses:>6}")
+
+if __name__ == "__main__":
+    main()
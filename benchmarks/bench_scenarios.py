@@ -0,0 +1,261 @@
+# Drives the real game code through named stress scenarios with no display
+# and compares per-frame update/render times against a committed baseline.
+#   python benchmarks/bench_scenarios.py                     (compare with baseline.json)
+#   python benchmarks/bench_scenarios.py --out results.json --scenario explosions
+#   python benchmarks/bench_scenarios.py --update-baseline   (after an intentional change)
+#   python benchmarks/bench_scenarios.py --renderer both     (surface vs texture backend, side by side)
+# Baselines are machine specific; regenerate on the machine that runs the comparison.
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+pygame.init()
+
+from game.constants import *
+from game import globals
+from game import core
+from game import data
+from game import inputs
+from game import particles
+from game import ui
+from game import projectiles
+from game import renderer
+from game.entities import Enemy
+from game.scheduler import enemy_fire
+from game.starfield import Starfield
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SEED = 1234
+WARMUP_FRAMES = 30
+MEMORY_FRAMES = 60
+# Regressions smaller than this are treated as noise whatever the ratio
+NOISE_FLOOR_MS = 0.05
+
+EXPLOSION_COLORS = (NEON_RED, NEON_ORANGE, NEON_PURPLE, NEON_BLUE)
+
+def draw_world(screen):
+    globals.starfield.draw(screen)
+    globals.all_sprites.draw(screen)
+    projectiles.enemy_bullets.draw(screen)
+    particles.system.draw(screen)
+
+def draw_playing(display):
+    # Same work as the PLAYING branch of the main loop
+    display.clear()
+    sx, sy = int(globals.shake_offset[0]), int(globals.shake_offset[1])
+    ui.draw_playing(display.target, (sx, sy), 1.0)
+
+def step_invulnerable():
+    # Keep the player alive so a scenario measures the same load throughout
+    globals.player.health = 10**9
+    core.step()
+    globals.player.health = globals.player.max_health
+    globals.game_state = GameState.PLAYING
+
+# --- Scenarios ---
+# Each setup returns (update, render); update may be None for UI-only scenarios.
+
+def scenario_enemies_firing():
+    core.start_game(SEED)
+
+    def update():
+        while len(globals.enemies) < 200:
+            e = Enemy(globals.rng.randint(40, SCREEN_WIDTH - 40), globals.rng.randint(-50, 300), 3.0)
+            enemy_fire.schedule(e, globals.tick + globals.rng.randint(0, 30))
+            globals.all_sprites.add(e)
+            globals.enemies.add(e)
+        step_invulnerable()
+    return update, draw_playing
+
+def scenario_enemy_bullets(count):
+    def setup():
+        core.start_game(SEED)
+        store = projectiles.enemy_bullets
+
+        def update():
+            while store.count < count:
+                store.spawn(globals.rng.randint(0, SCREEN_WIDTH), globals.rng.randint(-20, SCREEN_HEIGHT - 20), 0, 6, NEON_RED)
+            step_invulnerable()
+        return update, draw_playing
+    return setup
+
+def scenario_explosions():
+    core.start_game(SEED)
+
+    def update():
+        for i in range(4):
+            particles.create_explosion(globals.rng.randint(0, SCREEN_WIDTH), globals.rng.randint(0, SCREEN_HEIGHT),
+                                       EXPLOSION_COLORS[i])
+        step_invulnerable()
+    return update, draw_playing
+
+def scenario_idle_menu():
+    globals.game_state = GameState.MENU
+    globals.frame_dt = SIM_DT
+    return None, lambda display: ui.draw_menu(display.target)
+
+def scenario_game_over():
+    core.start_game(SEED)
+    for _ in range(120):
+        step_invulnerable()
+    globals.game_state = GameState.GAME_OVER
+    ui.thaw_backdrop()
+    return None, lambda display: ui.draw_game_over(display.target, draw_world)
+
+SCENARIOS = {
+    "enemies_200_firing": scenario_enemies_firing,
+    "enemy_bullets_2000": scenario_enemy_bullets(2000),
+    "enemy_bullets_5000": scenario_enemy_bullets(5000),
+    "explosions": scenario_explosions,
+    "idle_menu": scenario_idle_menu,
+    "game_over_overlay": scenario_game_over,
+}
+
+# --- Measurement ---
+def summarize(samples):
+    if not samples:
+        return {"mean": 0.0, "p95": 0.0, "p99": 0.0}
+    ordered = sorted(samples)
+    pick = lambda p: ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+    return {"mean": round(sum(ordered) / len(ordered), 4), "p95": round(pick(0.95), 4), "p99": round(pick(0.99), 4)}
+
+def run_frames(display, update, render, frames):
+    # Render time includes presenting, since the texture backend defers its work to there
+    update_ms, render_ms = [], []
+    for _ in range(frames):
+        start = time.perf_counter()
+        if update is not None:
+            update()
+        mid = time.perf_counter()
+        render(display)
+        display.flip()
+        end = time.perf_counter()
+        update_ms.append((mid - start) * 1000.0)
+        render_ms.append((end - mid) * 1000.0)
+    return update_ms, render_ms
+
+def run_scenario(display, name, frames):
+    globals.renderer = display
+    update, render = SCENARIOS[name]()
+    run_frames(display, update, render, WARMUP_FRAMES)
+    update_ms, render_ms = run_frames(display, update, render, frames)
+
+    # Separate pass for memory, since tracing allocations skews the timings
+    update, render = SCENARIOS[name]()
+    tracemalloc.start()
+    run_frames(display, update, render, MEMORY_FRAMES)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "frames": frames,
+        "update_ms": summarize(update_ms if update is not None else []),
+        "render_ms": summarize(render_ms),
+        "peak_kib": round(peak / 1024.0, 1),
+    }
+
+def compare(results, baseline, threshold):
+    # Returns a list of regression messages
+    failures = []
+    for name, result in results.items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            print(f"  {name}: no baseline")
+            continue
+        for phase in ("update_ms", "render_ms"):
+            for stat in ("mean", "p95"):
+                now, then = result[phase][stat], base[phase][stat]
+                if now > then * (1.0 + threshold) and now - then > NOISE_FLOOR_MS:
+                    failures.append(f"{name} {phase} {stat}: {now:.3f} ms vs baseline {then:.3f} ms (+{(now / then - 1) * 100:.0f}%)")
+    return failures
+
+def print_comparison(results, names):
+    print(f"\n{'render ms':<22} {'surface mean/p95':>18} {'texture mean/p95':>18} {'speedup':>8}")
+    for name in names:
+        s, t = results[name]["render_ms"], results[f"{name}@texture"]["render_ms"]
+        speedup = s["mean"] / t["mean"] if t["mean"] else 0.0
+        print(f"{name:<22} {s['mean']:>8.3f} {s['p95']:>9.3f} {t['mean']:>8.3f} {t['p95']:>9.3f} {speedup:>7.2f}x")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scenario benchmarks for the game loop.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="run only this scenario (repeatable)")
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per scenario")
+    parser.add_argument("--out", help="write results as JSON")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--renderer", choices=renderer.BACKENDS + ("both",), default="surface",
+                        help="backend to draw with; both runs every scenario on each and compares them")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with these results")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    # The surface backend sets the display mode, so it comes first either way;
+    # the texture backend uses SDL's software renderer to match any machine
+    backends = renderer.BACKENDS if args.renderer == "both" else (args.renderer,)
+    displays = {name: renderer.create(name, (SCREEN_WIDTH, SCREEN_HEIGHT), "bench", software=True) for name in backends}
+    globals.init_fonts()
+    globals.starfield = Starfield()
+    globals.save_enabled = False
+    data.load_game_data()
+    ui.init_menu_buttons()
+    ui.init_game_over_buttons()
+    inputs.scripted_move = 0
+
+    # Texture backend results are stored as "scenario@texture"
+    results = {}
+    print(f"{'scenario':<30} {'update mean/p95/p99 ms':>26} {'render mean/p95/p99 ms':>26} {'peak KiB':>10}")
+    for name in args.scenario or SCENARIOS:
+        for backend, display in displays.items():
+            key = name if backend == "surface" else f"{name}@{backend}"
+            r = run_scenario(display, name, args.frames)
+            results[key] = r
+            u, d = r["update_ms"], r["render_ms"]
+            print(f"{key:<30} {u['mean']:>8.3f} {u['p95']:>8.3f} {u['p99']:>8.3f} {d['mean']:>8.3f} {d['p95']:>8.3f} {d['p99']:>8.3f} {r['peak_kib']:>10.1f}")
+
+    if len(displays) > 1:
+        print_comparison(results, args.scenario or SCENARIOS)
+
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "scenarios": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except OSError:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    failures = compare(results, baseline, args.threshold)
+    if failures:
+        print(f"Regressions beyond {args.threshold * 100:.0f}%:")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    print(f"No regressions beyond {args.threshold * 100:.0f}% against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
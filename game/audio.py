@@ -1,80 +1,43 @@
 import pygame
 import numpy as np
 from . import globals
+from . import audio_cache
+from .voices import manager as voices
+from . import music
+
+SAMPLE_RATE = 44100
+
+def synth_sound(frequency, duration, wave_type="sine", decay=True):
+    sample_rate = SAMPLE_RATE
+    frames = int(sample_rate * duration)
+    t = np.arange(frames) / sample_rate
+    
+    if wave_type == "sine":
+        wave = np.sin(2 * np.pi * frequency * t)
+    elif wave_type == "square":
+        wave = np.sign(np.sin(2 * np.pi * frequency * t))
+    elif wave_type == "noise":
+        wave = np.random.uniform(-1, 1, frames)
+    elif wave_type == "sawtooth":
+         wave = 2 * (t * frequency - np.floor(t * frequency + 0.5))
+    else:
+        wave = np.sin(2 * np.pi * frequency * t)
+
+    if decay:
+        envelope = np.exp(-4 * t / duration)
+        wave = wave * envelope
+    
+    wave = (wave * 32767 * 0.3).astype(np.int16)
+    return np.column_stack((wave, wave))
 
 def create_sound(frequency, duration, wave_type="sine", decay=True):
     try:
-        sample_rate = 44100
-        frames = int(sample_rate * duration)
-        t = np.arange(frames) / sample_rate
-        
-        if wave_type == "sine":
-            wave = np.sin(2 * np.pi * frequency * t)
-        elif wave_type == "square":
-            wave = np.sign(np.sin(2 * np.pi * frequency * t))
-        elif wave_type == "noise":
-            wave = np.random.uniform(-1, 1, frames)
-        elif wave_type == "sawtooth":
-             wave = 2 * (t * frequency - np.floor(t * frequency + 0.5))
-        else:
-            wave = np.sin(2 * np.pi * frequency * t)
-
-        if decay:
-            envelope = np.exp(-4 * t / duration)
-            wave = wave * envelope
-        
-        wave = (wave * 32767 * 0.3).astype(np.int16)
-        sound_array = np.column_stack((wave, wave))
+        params = ("sfx", SAMPLE_RATE, frequency, duration, wave_type, decay)
+        sound_array = audio_cache.load_or_synthesize(params, lambda: synth_sound(frequency, duration, wave_type, decay))
         return pygame.sndarray.make_sound(sound_array)
     except Exception as e:
         return None
 
-def generate_background_music():
-    try:
-        sample_rate = 44100
-        duration = 12.0
-        frames = int(sample_rate * duration)
-        t = np.arange(frames) / sample_rate
-        
-        # Cyberpunk Bass Line
-        freqs = [110, 110, 130.8, 98] # A2, A2, C3, G2
-        wave = np.zeros(frames)
-        beat_len = frames // 16
-        
-        for i in range(16):
-            # Bass
-            f = freqs[(i // 4) % 4]
-            start = i * beat_len
-            end = (i+1) * beat_len
-            sect_t = t[start:end]
-            w = np.sign(np.sin(2 * np.pi * f * sect_t)) * 0.5 # Square bass
-            w *= np.exp(-3 * (sect_t - sect_t[0])) # Pluck envelope
-            wave[start:end] += w
-            
-            # Hi-hats
-            if i % 2 == 0:
-                noise = np.random.uniform(-0.1, 0.1, len(sect_t))
-                noise *= np.exp(-20 * (sect_t - sect_t[0]))
-                wave[start:end] += noise
-
-        # Arpeggios
-        arp_freqs = [440, 554, 659, 880]
-        for i in range(32):
-             f = arp_freqs[i % 4]
-             if i % 8 > 4: f *= 1.5 # Variation
-             start = int(i * (frames / 32))
-             end = int((i+1) * (frames / 32))
-             if end > frames: break
-             sect_t = t[start:end]
-             w = np.sin(2 * np.pi * f * sect_t) * 0.1
-             w *= np.exp(-5 * (sect_t - sect_t[0]))
-             wave[start:end] += w
-
-        wave = (wave * 32767 * 0.2).astype(np.int16)
-        return pygame.sndarray.make_sound(np.column_stack((wave, wave)))
-    except:
-        return None
-
 def load_all_sounds():
     print("Synthesizing Audio...")
     globals.sounds["shoot"] = create_sound(880, 0.15, "square")
@@ -94,23 +57,23 @@ def load_all_sounds():
     globals.sounds["hit"] = create_sound(150, 0.2, "noise")
     globals.sounds["wave"] = create_sound(300, 1.0, "sine")
     
-    globals.background_music = generate_background_music()
-    print("Audio Ready.")
+    cache = audio_cache.stats()
+    print(f"Audio Ready. Cache: {cache['hits']} hits, {cache['misses']} misses, saved {cache['saved_ms']:.0f} ms")
 
 def play_sound(name):
     if name in globals.sounds and globals.sounds[name]:
-        globals.sounds[name].set_volume(globals.sfx_volume)
-        globals.sounds[name].play()
+        voices.play(name, globals.sounds[name], globals.sfx_volume)
 
 def play_background_music():
-    if globals.background_music:
-        globals.background_music.set_volume(globals.music_volume)
-        globals.background_music.play(-1)
+    if voices.ready():
+        music.stream.start(voices.music_channel(), globals.music_volume)
+
+def stop_background_music():
+    music.stream.stop()
 
 def change_volume(amount):
     globals.music_volume = max(0.0, min(1.0, globals.music_volume + amount))
-    if globals.background_music:
-        globals.background_music.set_volume(globals.music_volume)
+    music.stream.set_volume(globals.music_volume)
 
 def change_sfx_volume(amount):
     globals.sfx_volume = max(0.0, min(1.0, globals.sfx_volume + amount))
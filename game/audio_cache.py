@@ -0,0 +1,75 @@
+import os
+import json
+import time
+import hashlib
+import numpy as np
+from . import data
+
+# Synthesized sounds are stored as raw interleaved int16 stereo buffers,
+# one file per sound, named by a hash of the synthesis parameters. Changing
+# any parameter (or CACHE_VERSION) changes the hash, so stale entries are
+# simply never looked up again.
+CACHE_VERSION = 1
+INDEX_FILE_NAME = "index.json"
+
+hits = 0
+misses = 0
+saved_ms = 0.0
+_index = None
+
+def cache_dir():
+    return os.path.join(data.save_dir, "audio_cache")
+
+def cache_key(params):
+    return hashlib.sha1(repr((CACHE_VERSION, params)).encode("utf-8")).hexdigest()
+
+def _load_index():
+    global _index
+    if _index is None:
+        try:
+            with open(os.path.join(cache_dir(), INDEX_FILE_NAME), "r") as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+def _write_atomic(path, payload):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+def load_or_synthesize(params, synthesize):
+    global hits, misses, saved_ms
+    key = cache_key(params)
+    path = os.path.join(cache_dir(), key + ".pcm")
+    index = _load_index()
+    entry = index.get(key)
+
+    if entry is not None:
+        start = time.perf_counter()
+        try:
+            samples = np.fromfile(path, dtype=np.int16)
+            if samples.size == entry["frames"] * 2:
+                hits += 1
+                saved_ms += entry["synth_ms"] - (time.perf_counter() - start) * 1000.0
+                return samples.reshape(-1, 2)
+        except OSError:
+            pass
+
+    start = time.perf_counter()
+    samples = synthesize()
+    synth_ms = (time.perf_counter() - start) * 1000.0
+    misses += 1
+
+    try:
+        os.makedirs(cache_dir(), exist_ok=True)
+        _write_atomic(path, np.ascontiguousarray(samples, dtype=np.int16).tobytes())
+        index[key] = {"frames": len(samples), "synth_ms": synth_ms}
+        _write_atomic(os.path.join(cache_dir(), INDEX_FILE_NAME), json.dumps(index).encode("utf-8"))
+    except OSError as e:
+        print(f"Could not write audio cache: {e}")
+    return samples
+
+def stats():
+    return {"hits": hits, "misses": misses, "saved_ms": saved_ms}
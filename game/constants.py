@@ -43,3 +43,83 @@ DIFFICULTY_PARAMS = {
     Difficulty.EXTREME: ("EXTREME", 2.0),
     Difficulty.NIGHTMARE: ("NIGHTMARE", 3.0)
 }
+
+# Particles
+MAX_PARTICLES = 4096
+PARTICLE_ALPHA_LEVELS = 32
+
+# Object pools
+POOL_MAX_SIZE = 1024
+
+# Collision broadphase
+COLLISION_CELL_SIZE = 64
+COLLISION_HASH_MIN_PAIRS = 5000 # Below this many pairs pygame's brute force is faster
+
+# Simulation
+SIM_FPS = 60
+SIM_DT = 1.0 / SIM_FPS
+MAX_CATCHUP_STEPS = 5 # Sim steps allowed per rendered frame before dropping time
+RENDER_FPS_CAP = 60 # Default frame cap; running uncapped is opt-in
+
+# Background
+STAR_COUNT = 600
+STAR_LAYERS = 4
+
+# Startup
+STARTUP_BUDGET_MS = 300
+
+# Audio voices: mixer channels per category
+VOICE_GROUPS = {
+    "music": 1,
+    "critical": 3,
+    "player": 4,
+    "enemy": 4
+}
+
+# Sound name -> (category, priority, max simultaneous copies)
+SOUND_VOICES = {
+    "gameover": ("critical", 5, 1),
+    "explosion": ("critical", 4, 3),
+    "wave": ("critical", 3, 1),
+    "powerup": ("critical", 3, 1),
+    "hit": ("player", 2, 2),
+    "shoot": ("player", 2, 2),
+    "enemy_shoot": ("enemy", 1, 3)
+}
+DEFAULT_SOUND_VOICE = ("player", 1, 2)
+
+# Music streaming
+MUSIC_CHUNK_BEATS = 2 # 1.5 s per synthesized buffer
+
+# Text rendering
+TEXT_CACHE_SIZE = 256
+
+# Save data
+JOURNAL_COMPACT_EVERY = 20 # Runs appended before the snapshot is rewritten
+HISTORY_TOP_RUNS = 3
+HISTORY_TREND_RUNS = 10 # Recent runs compared against the ones before them
+
+# Profiler
+PROFILER_WINDOW = 240 # Frames in the rolling averages and graph
+PROFILER_REFRESH_MS = 250
+PROFILER_TRACE_MAX = 108000 # Frames kept for the CSV trace (30 min at 60 FPS)
+
+# Projectiles
+MAX_PROJECTILES = 8192
+ENEMY_BULLET_SIZE = 10 # Square hitbox, matches the enemy_bullet image
+
+# Wave timeline
+TIMELINE_CHUNK_LINES = 256 # Lines parsed per read when the queue runs low
+
+# Render queue
+RENDER_LAYERS = ("background", "trails", "projectiles", "pickups", "enemies", "player", "particles", "hud") # Back to front
+HEALTH_BAR_SIZE = (200, 20)
+TEXTURE_IDLE_FRAMES = 120 # Texture renderer drops uploads unused for this long
+
+# Frame pacing
+PACING_MODES = ("capped", "busy", "vsync", "uncapped")
+PACING_RATES = (30, 60, 75, 90, 120, 144, 165, 240)
+PACING_DEFAULT = ("capped", RENDER_FPS_CAP)
+PACING_WINDOW = 240 # Frames in the rolling jitter stats
+PACING_REFRESH_MS = 250 # Settings stats line redraw interval
+PACING_MISS_TOLERANCE = 0.5 # A frame misses its deadline past 1.5x the target interval
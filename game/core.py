@@ -1,80 +1,140 @@
-import pygame
 import random
+import numpy as np
 from .constants import *
 from . import globals
 from .entities import Player, Enemy, PowerUp
+from . import particles
+from . import projectiles
 from .particles import create_explosion
 from .audio import play_sound
 from .data import save_game_data
 from .utils import update_shake, add_shake
+from . import inputs
+from . import spatial
+from .profiler import profiler
+from . import replay
+from .scheduler import enemy_fire
+from . import timeline
 
-def start_game():
+def start_game(seed=None):
+    # Killing (rather than just emptying) hands pooled sprites back to their pools
+    for sprite in globals.all_sprites.sprites():
+        sprite.kill()
     globals.all_sprites.empty()
     globals.enemies.empty()
     globals.bullets.empty()
-    globals.enemy_bullets.empty()
+    projectiles.enemy_bullets.clear()
     globals.powerups.empty()
     globals.particles.empty()
+    particles.system.clear()
+    enemy_fire.clear()
+    
+    # Everything random in a run derives from one seed, so a run can be replayed
+    if seed is None:
+        seed = random.randrange(2**32)
+    globals.run_seed = seed
+    globals.rng.seed(seed)
+    particles.system.rng = np.random.default_rng(seed)
+    globals.sim_ticks = 0.0
+    globals.tick = 0
+    globals.shake_intensity = 0
+    globals.shake_offset = [0, 0]
     
     globals.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 60)
     globals.all_sprites.add(globals.player)
     
     globals.score = 0
     globals.wave = 1
-    globals.enemy_spawn_timer = 0
+    timeline.waves.start(DIFFICULTY_PARAMS[globals.current_difficulty][1])
     globals.game_state = GameState.PLAYING
     globals.game_time = 0.0
-    globals.last_frame_time = pygame.time.get_ticks()
+    globals.run_kills = {}
+    globals.run_damage = 0
+    globals.prev_positions = {}
+    inputs.consume_fire() # Drop fire presses from before the run
+    replay.begin_run(seed)
     
     play_sound("wave")
 
+def step():
+    # One fixed simulation tick. Positions are remembered first so the
+    # renderer can interpolate between the previous and current tick.
+    replay.begin_tick()
+    inputs.begin_tick()
+    globals.prev_positions = {sprite: sprite.rect.topleft for sprite in globals.all_sprites}
+    globals.tick += 1
+    update_game_logic()
+    globals.sim_ticks += 1000.0 / SIM_FPS
+    replay.end_tick()
+
+def interpolated_pos(sprite, alpha):
+    x, y = sprite.rect.topleft
+    prev = globals.prev_positions.get(sprite)
+    if prev is None:
+        return x, y
+    return int(prev[0] + (x - prev[0]) * alpha), int(prev[1] + (y - prev[1]) * alpha)
+
 def update_game_logic():
-    current_time = pygame.time.get_ticks()
-    dt = (current_time - globals.last_frame_time) / 1000.0
-    globals.last_frame_time = current_time
-    globals.game_time += dt
+    if globals.game_state != GameState.PLAYING:
+        return
+    globals.game_time += SIM_DT
     
     update_shake()
     
+    if inputs.tick_fire and globals.player:
+        globals.player.shoot()
+    
     # Difficulty scaling
     diff_mult = DIFFICULTY_PARAMS[globals.current_difficulty][1]
-    
-    if globals.game_time < 120:
-        base_diff = 1.0 + (globals.game_time / 60.0)
-    else:
-        base_diff = 3.0 + ((globals.game_time - 120) / 30.0)
-    
-    difficulty = base_diff * diff_mult
+    difficulty = timeline.ramp(globals.game_time) * diff_mult
         
-    globals.all_sprites.update()
-    
-    # Spawning
-    globals.enemy_spawn_timer += 1
-    spawn_rate = max(15, int(60 / (difficulty * 0.8)))
+    with profiler.section("movement"):
+        globals.all_sprites.update()
+        particles.system.update()
+        projectiles.enemy_bullets.update()
     
-    if globals.enemy_spawn_timer > spawn_rate:
-        e = Enemy(random.randint(40, SCREEN_WIDTH-40), -50, difficulty)
-        globals.all_sprites.add(e)
-        globals.enemies.add(e)
-        globals.enemy_spawn_timer = 0
+    # Spawning and waves, from the timeline
+    with profiler.section("spawn"):
+        for event in timeline.waves.pop_due(globals.tick):
+            if isinstance(event, timeline.WaveEvent):
+                globals.wave += 1
+                play_sound("wave")
+            else:
+                spawn_group(event, difficulty)
         
-    for enemy in globals.enemies:
-        enemy.shoot()
+    with profiler.section("shoot"):
+        for enemy in enemy_fire.pop_due(globals.tick):
+            enemy.shoot()
         
-    # Collisions
+    with profiler.section("collisions"):
+        check_collisions()
+
+def spawn_group(event, difficulty):
+    x = event.x if event.x is not None else globals.rng.randint(40, SCREEN_WIDTH-40)
+    kind = None if event.kind == "auto" else event.kind
+    for dx, dy in timeline.formation_offsets(event.formation, event.count):
+        ex = min(max(int(x + dx), 40), SCREEN_WIDTH-40)
+        e = Enemy(ex, -50 + int(dy), difficulty * event.mult, kind)
+        globals.all_sprites.add(e)
+        globals.enemies.add(e)
+
+def check_collisions():
+    if globals.game_state != GameState.PLAYING:
+        return
     # Bullet -> Enemy
-    hits = pygame.sprite.groupcollide(globals.enemies, globals.bullets, False, True) # Enemy, Bullet, KillE?, KillB?
+    hits = spatial.groupcollide(globals.enemies, globals.bullets, False, True) # Enemy, Bullet, KillE?, KillB?
     for enemy, hit_bullets in hits.items():
         # Using hit points
         enemy.hp -= len(hit_bullets)
         if enemy.hp <= 0:
             globals.score += 1 * (3 if enemy.type=="elite" else 1)
+            globals.run_kills[enemy.type] = globals.run_kills.get(enemy.type, 0) + 1
             create_explosion(enemy.rect.centerx, enemy.rect.centery, enemy.color)
             play_sound("explosion")
             enemy.kill()
             
             # Powerup
-            if random.random() < 0.25:
+            if globals.rng.random() < 0.25:
                 p = PowerUp(enemy.rect.centerx, enemy.rect.centery, "heal")
                 globals.all_sprites.add(p)
                 globals.powerups.add(p)
@@ -82,29 +142,26 @@ def update_game_logic():
             play_sound("hit")
             
     # Player -> Enemy/Bullet
-    if globals.player and pygame.sprite.spritecollide(globals.player, globals.enemies, True):
+    if globals.player and spatial.spritecollide(globals.player, globals.enemies, True):
         play_sound("explosion")
         create_explosion(globals.player.rect.centerx, globals.player.rect.centery, NEON_RED)
         if not globals.player.take_damage(20):
             globals.game_state = GameState.GAME_OVER
             save_game_data()
             play_sound("gameover")
+            return
             
-    hits = pygame.sprite.spritecollide(globals.player, globals.enemy_bullets, True)
+    hits = projectiles.enemy_bullets.collide_rect(globals.player.rect)
     if hits:
         play_sound("hit")
-        if not globals.player.take_damage(10 * len(hits)):
+        if not globals.player.take_damage(10 * hits):
             globals.game_state = GameState.GAME_OVER
             save_game_data()
             play_sound("gameover")
+            return
 
     # Powerups
-    hits = pygame.sprite.spritecollide(globals.player, globals.powerups, True)
+    hits = spatial.spritecollide(globals.player, globals.powerups, True)
     for p in hits:
         globals.player.health = min(globals.player.max_health, globals.player.health + 30)
         play_sound("powerup")
-        
-    # Wave Manager
-    if int(globals.game_time) // 30 > globals.wave:
-        globals.wave += 1
-        play_sound("wave")
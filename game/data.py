@@ -1,11 +1,15 @@
 import os
-import pickle
+import time
 from .constants import Difficulty, DIFFICULTY_PARAMS
 from . import globals
+from . import save_service
+from .history import RunHistory
 
 import shutil
 
 SAVE_FILE__NAME = "save_data.dat"
+JOURNAL_FILE__NAME = "save_data.journal"
+HISTORY_FILE__NAME = "history.db"
 
 # Determine path based on OS to hide the save file
 if os.name == 'nt':
@@ -15,45 +19,60 @@ else:
     # Unix-like: ~/.local/share/SpaceShooter
     save_dir = os.path.join(os.path.expanduser('~'), '.local', 'share', 'SpaceShooter')
 
-# Ensure directory exists
-os.makedirs(save_dir, exist_ok=True)
-
 SAVE_FILE = os.path.join(save_dir, SAVE_FILE__NAME)
+JOURNAL_FILE = os.path.join(save_dir, JOURNAL_FILE__NAME)
+HISTORY_FILE = os.path.join(save_dir, HISTORY_FILE__NAME)
 OLD_SAVE_FILE = SAVE_FILE__NAME
 
-# Migrate legacy save file if it exists in the root directory
-if os.path.exists(OLD_SAVE_FILE):
-    try:
-        # If destination exists (and source also exists), we might want to keep the newer one? 
-        # For simplicity, if destination doesn't exist, we move. 
-        # If destination exists, we might ignore the old one or overwrite.
-        # Let's assume if target exists, it's the valid one. Only move if target missing.
-        if not os.path.exists(SAVE_FILE):
-            shutil.move(OLD_SAVE_FILE, SAVE_FILE)
-            print(f"Migrated save file to: {SAVE_FILE}")
-        else:
-            # If both exist, check which is newer.
-            # This handles the case where the user played and saved to the old location
-            # after we created the new location but before restarting the game.
-            old_mtime = os.path.getmtime(OLD_SAVE_FILE)
-            new_mtime = os.path.getmtime(SAVE_FILE)
-            
-            if old_mtime > new_mtime:
-                try:
-                    # Remove old destination to allow move
-                    os.remove(SAVE_FILE)
-                    shutil.move(OLD_SAVE_FILE, SAVE_FILE)
-                    print(f"Updated hidden save with newer file from root.")
-                except Exception as e:
-                    print(f"Failed to update hidden save: {e}")
+# Writes happen on a background thread; see save_service.py
+history = RunHistory(HISTORY_FILE)
+saver = save_service.SaveService(SAVE_FILE, JOURNAL_FILE, history)
+
+_storage_ready = False
+
+def init_storage():
+    # Filesystem side effects live here rather than at import time
+    global _storage_ready
+    if _storage_ready:
+        return
+    _storage_ready = True
+
+    # Ensure directory exists
+    os.makedirs(save_dir, exist_ok=True)
+
+    # Migrate legacy save file if it exists in the root directory
+    if os.path.exists(OLD_SAVE_FILE):
+        try:
+            # If destination exists (and source also exists), we might want to keep the newer one? 
+            # For simplicity, if destination doesn't exist, we move. 
+            # If destination exists, we might ignore the old one or overwrite.
+            # Let's assume if target exists, it's the valid one. Only move if target missing.
+            if not os.path.exists(SAVE_FILE):
+                shutil.move(OLD_SAVE_FILE, SAVE_FILE)
+                print(f"Migrated save file to: {SAVE_FILE}")
             else:
-                try:
-                    os.remove(OLD_SAVE_FILE)
-                    print("Removed redundant save file from root.")
-                except:
-                    pass
-    except Exception as e:
-        print(f"Failed to migrate save file: {e}")
+                # If both exist, check which is newer.
+                # This handles the case where the user played and saved to the old location
+                # after we created the new location but before restarting the game.
+                old_mtime = os.path.getmtime(OLD_SAVE_FILE)
+                new_mtime = os.path.getmtime(SAVE_FILE)
+                
+                if old_mtime > new_mtime:
+                    try:
+                        # Remove old destination to allow move
+                        os.remove(SAVE_FILE)
+                        shutil.move(OLD_SAVE_FILE, SAVE_FILE)
+                        print(f"Updated hidden save with newer file from root.")
+                    except Exception as e:
+                        print(f"Failed to update hidden save: {e}")
+                else:
+                    try:
+                        os.remove(OLD_SAVE_FILE)
+                        print("Removed redundant save file from root.")
+                    except:
+                        pass
+        except Exception as e:
+            print(f"Failed to migrate save file: {e}")
 
 def update_globals_from_data():
     key = globals.current_difficulty.name
@@ -61,22 +80,21 @@ def update_globals_from_data():
     globals.games_played = globals.game_data[key]["games_played"]
 
 def load_game_data():
+    init_storage()
+    
     # Initialize defaults first
     for diff in Difficulty:
         globals.game_data[diff.name] = {"high_score": 0, "games_played": 0}
 
-    # Try to load from file
-    if os.path.exists(SAVE_FILE):
-        try:
-            with open(SAVE_FILE, "rb") as f:
-                saved_data = pickle.load(f)
-                # Merge saved data purely to be safe, or just replace
-                # We'll valid keys to avoid corruption issues
-                for key in globals.game_data:
-                    if key in saved_data:
-                        globals.game_data[key] = saved_data[key]
-        except Exception as e:
-            print(f"Error loading save data: {e}")
+    # Try to load from file: last snapshot plus the journal of runs since
+    journal_records, last_seq = [], 0
+    try:
+        journal_records, last_seq = save_service.load(SAVE_FILE, JOURNAL_FILE, globals.game_data)
+    except Exception as e:
+        print(f"Error loading save data: {e}")
+
+    if globals.save_enabled:
+        saver.start(globals.game_data, journal_records, last_seq)
 
     # Set current globals based on current difficulty
     update_globals_from_data()
@@ -90,12 +108,31 @@ def save_game_data():
         
     globals.game_data[key]["games_played"] += 1
     
-    # Write to file
+    if not globals.save_enabled:
+        return
+    
+    # Queue a journal record; the writer thread does the disk work
+    saver.record_run({
+        "difficulty": key,
+        "score": globals.score,
+        "played_at": time.time(),
+        "duration": round(globals.game_time, 2),
+        "wave": globals.wave,
+        "damage": globals.run_damage,
+        "kills": dict(globals.run_kills),
+    })
+
+def run_summary():
+    # Aggregates for the STATS screen, queried once and memoized by RunHistory
+    init_storage()
     try:
-        with open(SAVE_FILE, "wb") as f:
-            pickle.dump(globals.game_data, f)
+        return history.summary(globals.current_difficulty.name)
     except Exception as e:
-        print(f"Error saving game data: {e}")
+        print(f"Error reading run history: {e}")
+        return None
+
+def shutdown():
+    saver.shutdown()
 
 def change_difficulty(direction):
     difficulty_keys = list(DIFFICULTY_PARAMS.keys())
@@ -0,0 +1,82 @@
+from . import globals
+from . import particles
+from . import projectiles
+from . import pool
+from . import sprite_cache
+from . import text_cache
+from . import data
+from . import render_queue
+from .pacing import pacer
+from .scheduler import enemy_fire
+from .timeline import waves
+from .voices import manager as voices
+
+def entity_counts():
+    return {
+        "sprites": len(globals.all_sprites),
+        "enemies": len(globals.enemies),
+        "bullets": len(globals.bullets),
+        "enemy_bullets": projectiles.enemy_bullets.count,
+        "powerups": len(globals.powerups),
+        "trails": len(globals.particles),
+        "particles": particles.system.count,
+    }
+
+def frame_counts():
+    # Entity counts plus what the render queue did last frame
+    counts = entity_counts()
+    counts.update(render_queue.queue.stats())
+    return counts
+
+def stats_lines():
+    lines = []
+    p = particles.system.stats()
+    lines.append(f"Particles: {p['live']} live, {p['peak']} peak (cap {p['capacity']})")
+
+    b = projectiles.enemy_bullets.stats()
+    lines.append(f"Enemy bullets: {b['live']} live, {b['peak']} peak (cap {b['capacity']}), {b['dropped']} dropped")
+
+    if globals.renderer is not None:
+        d = globals.renderer.stats()
+        if d["backend"] == "texture":
+            lines.append(f"Renderer: texture ({'software' if d['software'] else 'default'} SDL renderer), {d['textures']} textures, {d['uploads']} uploads, {d['evicted']} evicted")
+        else:
+            lines.append(f"Renderer: {d['backend']}")
+
+    fp = pacer.stats()
+    vsync = ", vsync on" if fp["vsync"] else ""
+    if fp["frames"]:
+        lines.append(f"Frame pacing: {fp['mode']} {fp['rate']} Hz{vsync}, {fp['mean_ms']:.2f} ms mean, {fp['std_ms']:.2f} ms std dev, "
+                     f"{fp['jitter_ms']:.2f} ms jitter, {fp['missed']} of {fp['frames']} frames missed deadline")
+
+    r = render_queue.queue.stats()
+    lines.append(f"Render queue: {r['draw_calls']} draw calls, {r['blits']} blits, {r['culled']} culled last frame")
+
+    c = sprite_cache.stats()
+    lines.append(f"Sprite cache: {c['images']} images, {c['hits']} hits, {c['misses']} misses, {c['bytes'] / 1024:.1f} KiB")
+
+    for name, s in pool.stats().items():
+        lines.append(f"Pool {name}: {s['reuse_rate'] * 100:.1f}% reused ({s['created']} created), high-water {s['high_water']}, discarded {s['discarded']}")
+
+    t = text_cache.stats()
+    lines.append(f"Text cache: {t['hit_rate'] * 100:.1f}% hit rate ({t['hits']} hits, {t['misses']} misses, {t['evictions']} evicted), {t['entries']} entries")
+
+    v = voices.stats()
+    lines.append(f"Voices: {v['played']} played, {v['dropped']} dropped, {v['stolen']} stolen, {v['volume_skips']} volume calls skipped")
+
+    tl = waves.stats()
+    lines.append(f"Wave timeline: {tl['popped']} events, {tl['chunks']} chunks parsed, {tl['pending']} queued")
+
+    f = enemy_fire.stats()
+    lines.append(f"Enemy fire: {f['fired']} fired, {f['cancelled']} cancelled lazily, {f['pending']} pending")
+
+    w = data.saver.stats()
+    lines.append(f"Save writer: {w['writes']} journal writes, {w['compactions']} compactions, {w['queued']} queued, {w['errors']} errors")
+
+    h = data.history.stats()
+    lines.append(f"Run history: {h['version']} commits, {h['queries']} summary queries")
+    return lines
+
+def print_stats():
+    for line in stats_lines():
+        print(line)
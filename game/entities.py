@@ -1,44 +1,31 @@
 import pygame
-import random
 import math
+import itertools
 from .constants import *
 from . import globals
-from .utils import add_shake
+from .utils import add_shake, get_ticks
+from . import inputs
+from . import sprite_cache
+from .pool import Pool, PooledSprite
+from .framebank import FrameBank
 from .audio import play_sound
 from .particles import TrailParticle
-
-class Star:
-    def __init__(self):
-        self.reset()
-        self.y = random.randint(0, SCREEN_HEIGHT) # Start sparsely populated
-
-    def reset(self):
-        self.x = random.randint(0, SCREEN_WIDTH)
-        self.y = -10
-        self.z = random.uniform(0.5, 3.0) # Depth/Speed factor
-        self.size = random.uniform(1, 3)
-        self.brightness = random.randint(100, 255)
-
-    def update(self, speed_mult=1.0):
-        self.y += (1 + self.z) * speed_mult
-        if self.y > SCREEN_HEIGHT:
-            self.reset()
-
-    def draw(self, surface):
-        color = (self.brightness, self.brightness, self.brightness)
-        # Parallax blending
-        pygame.draw.circle(surface, color, (int(self.x), int(self.y)), int(self.size / 2))
-
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.Surface((8, 20), pygame.SRCALPHA)
-        # Glowing effect drawn on surface
-        color = NEON_YELLOW
-        # Core
-        pygame.draw.rect(self.image, WHITE, (2, 5, 4, 10))
-        # Glow
-        pygame.draw.rect(self.image, (*color, 100), (0, 0, 8, 20), border_radius=4)
+from .scheduler import enemy_fire
+from . import projectiles
+
+@sprite_cache.register("bullet")
+def build_bullet_image(color):
+    image = pygame.Surface((8, 20), pygame.SRCALPHA)
+    # Glowing effect drawn on surface
+    # Core
+    pygame.draw.rect(image, WHITE, (2, 5, 4, 10))
+    # Glow
+    pygame.draw.rect(image, (*color, 100), (0, 0, 8, 20), border_radius=4)
+    return image
+
+class Bullet(PooledSprite):
+    def reset(self, x, y):
+        self.image = sprite_cache.get_image("bullet", NEON_YELLOW)
         
         self.rect = self.image.get_rect()
         self.rect.centerx = x
@@ -50,24 +37,35 @@ class Bullet(pygame.sprite.Sprite):
         if self.rect.bottom < 0:
             self.kill()
 
-class EnemyBullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, speed=5, color=NEON_RED):
-        super().__init__()
-        self.image = pygame.Surface((10, 10), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (5, 5), 4)
-        pygame.draw.circle(self.image, WHITE, (5, 5), 2)
-        
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.top = y
-        self.pos_y = float(y)
-        self.speed = speed
-
-    def update(self):
-        self.pos_y += self.speed
-        self.rect.y = int(self.pos_y)
-        if self.rect.top > SCREEN_HEIGHT:
-            self.kill()
+Bullet.pool = Pool(Bullet)
+
+@sprite_cache.register("player")
+def build_player_image(tilt):
+    # Local coordinates for image
+    w, h = 40, 50
+    image = pygame.Surface((w, h), pygame.SRCALPHA)
+    
+    # Simple tilt skewing
+    # We want the top of the ship to lean
+    offset_top = tilt * 0.5
+    
+    local_points = [
+        (w/2 + offset_top, 0),
+        (0, h),
+        (w/2, h*0.8),
+        (w, h)
+    ]
+
+    # Draw ship body
+    pygame.draw.polygon(image, NEON_GREEN, local_points)
+    pygame.draw.polygon(image, WHITE, local_points, 2) # Outline
+    
+    # Cockpit
+    pygame.draw.circle(image, NEON_BLUE, (int(w//2 + offset_top * 0.5), int(h//2)), 6)
+    return image
+
+# Ship frames for tilt -15..15, one per degree
+PLAYER_FRAMES = FrameBank("player", -15, 15, 31)
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
@@ -75,7 +73,7 @@ class Player(pygame.sprite.Sprite):
         # Size for collision
         self.width = 40
         self.height = 50
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.image = PLAYER_FRAMES.get(0)
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
@@ -83,16 +81,16 @@ class Player(pygame.sprite.Sprite):
         self.speed = 6
         self.health = 100
         self.max_health = 100
-        self.last_shot = 0
         self.shoot_delay = 180 
+        self.last_shot = -self.shoot_delay
         self.tilt = 0 # For visual banking logic
 
     def update(self):
-        keys = pygame.key.get_pressed()
+        move = inputs.tick_move
         dx = 0
-        if (keys[pygame.K_LEFT] or keys[pygame.K_a]) and self.rect.left > 0:
+        if move < 0 and self.rect.left > 0:
             dx = -1
-        if (keys[pygame.K_RIGHT] or keys[pygame.K_d]) and self.rect.right < SCREEN_WIDTH:
+        if move > 0 and self.rect.right < SCREEN_WIDTH:
             dx = 1
         
         self.pos_x += dx * self.speed
@@ -111,19 +109,19 @@ class Player(pygame.sprite.Sprite):
         self.tilt = self.tilt * 0.8 + target_tilt * 0.2
         
         # Engine trails
-        if random.random() < 0.8:
-            offset_x = random.randint(-5, 5)
-            p = TrailParticle(self.rect.centerx + offset_x, self.rect.bottom - 5, NEON_BLUE)
+        if globals.rng.random() < 0.8:
+            offset_x = globals.rng.randint(-5, 5)
+            p = TrailParticle.spawn(self.rect.centerx + offset_x, self.rect.bottom - 5, NEON_BLUE)
             globals.all_sprites.add(p)
             globals.particles.add(p)
             
-        self.update_image()
+        self.image = PLAYER_FRAMES.get(self.tilt)
 
     def shoot(self):
-        now = pygame.time.get_ticks()
+        now = get_ticks()
         if now - self.last_shot > self.shoot_delay:
-            bullet_left = Bullet(self.rect.centerx - 10, self.rect.top + 10)
-            bullet_right = Bullet(self.rect.centerx + 10, self.rect.top + 10)
+            bullet_left = Bullet.spawn(self.rect.centerx - 10, self.rect.top + 10)
+            bullet_right = Bullet.spawn(self.rect.centerx + 10, self.rect.top + 10)
             globals.all_sprites.add(bullet_left, bullet_right)
             globals.bullets.add(bullet_left, bullet_right)
             play_sound("shoot")
@@ -132,126 +130,109 @@ class Player(pygame.sprite.Sprite):
 
     def take_damage(self, damage):
         self.health -= damage
+        globals.run_damage += damage
         add_shake(10)
         return self.health > 0
 
-    def update_image(self):
-        # Calculate polygon points based on tilt
-        self.image.fill((0,0,0,0))
-        
-        # Local coordinates for image
-        w, h = self.width, self.height
-        
-        # Simple tilt skewing
-        # We want the top of the ship to lean
-        offset_top = self.tilt * 0.5
-        
-        local_points = [
-            (w/2 + offset_top, 0),
-            (0, h),
-            (w/2, h*0.8),
-            (w, h)
+@sprite_cache.register("enemy")
+def build_enemy_image(enemy_type, color):
+    w, h = 44, 40
+    image = pygame.Surface((w, h), pygame.SRCALPHA)
+    
+    if enemy_type == "elite":
+        # Hexagon
+        points = [
+            (w//2, 0), (w, h*0.3), (w, h*0.7),
+            (w//2, h), (0, h*0.7), (0, h*0.3)
         ]
-
-        # Draw ship body
-        pygame.draw.polygon(self.image, NEON_GREEN, local_points)
-        pygame.draw.polygon(self.image, WHITE, local_points, 2) # Outline
+        pygame.draw.polygon(image, color, points)
+        pygame.draw.polygon(image, WHITE, points, 2)
+    else:
+        # Invader shape (roughly)
+        rects = [
+            (w*0.2, 0, w*0.6, h*0.4),
+            (0, h*0.4, w, h*0.3),
+            (w*0.2, h*0.7, w*0.1, h*0.3),
+            (w*0.7, h*0.7, w*0.1, h*0.3)
+        ]
+        for r in rects:
+            pygame.draw.rect(image, color, r)
         
-        # Cockpit
-        pygame.draw.circle(self.image, NEON_BLUE, (int(w//2 + offset_top * 0.5), int(h//2)), 6)
+        # Eyes
+        eye_color = NEON_YELLOW
+        pygame.draw.rect(image, eye_color, (w*0.3, h*0.4, 6, 6))
+        pygame.draw.rect(image, eye_color, (w*0.7-6, h*0.4, 6, 6))
+    return image
 
 class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y, difficulty=1.0):
+    uids = itertools.count(1) # Owner ids for projectiles
+
+    def __init__(self, x, y, difficulty=1.0, kind=None):
         super().__init__()
+        self.uid = next(Enemy.uids)
         self.width = 44
         self.height = 40
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(topleft=(x, y))
+        self.rect = pygame.Rect(x, y, self.width, self.height)
         self.pos_x = float(x)
         self.pos_y = float(y)
         
         self.difficulty = difficulty
-        self.speed = random.uniform(1.5, 3.5) * (1 + (difficulty - 1) * 0.3)
-        self.shoot_timer = random.randint(30, 80)
+        self.speed = globals.rng.uniform(1.5, 3.5) * (1 + (difficulty - 1) * 0.3)
+        enemy_fire.schedule(self, globals.tick + globals.rng.randint(30, 80))
         self.angle = 0
-        self.rot_speed = random.uniform(-2, 2)
+        self.rot_speed = globals.rng.uniform(-2, 2)
         
         # Determine Type/Color
-        if difficulty > 2.5 and random.random() < 0.3:
+        # kind=None keeps the classic mix: elites appear once difficulty passes 2.5
+        if kind == "elite" or (kind is None and difficulty > 2.5 and globals.rng.random() < 0.3):
             self.type = "elite"
             self.color = NEON_PURPLE
             self.hp = 3
         else:
             self.type = "normal"
-            self.color = NEON_RED if  random.random() < 0.5 else NEON_ORANGE
+            self.color = NEON_RED if  globals.rng.random() < 0.5 else NEON_ORANGE
             self.hp = 1
             
-        self.draw_enemy()
-
-    def draw_enemy(self):
-        w, h = self.width, self.height
-        self.image.fill((0,0,0,0))
-        
-        if self.type == "elite":
-            # Hexagon
-            points = [
-                (w//2, 0), (w, h*0.3), (w, h*0.7),
-                (w//2, h), (0, h*0.7), (0, h*0.3)
-            ]
-            pygame.draw.polygon(self.image, self.color, points)
-            pygame.draw.polygon(self.image, WHITE, points, 2)
-        else:
-            # Invader shape (roughly)
-            rects = [
-                (w*0.2, 0, w*0.6, h*0.4),
-                (0, h*0.4, w, h*0.3),
-                (w*0.2, h*0.7, w*0.1, h*0.3),
-                (w*0.7, h*0.7, w*0.1, h*0.3)
-            ]
-            for r in rects:
-                pygame.draw.rect(self.image, self.color, r)
-            
-            # Eyes
-            eye_color = NEON_YELLOW
-            pygame.draw.rect(self.image, eye_color, (w*0.3, h*0.4, 6, 6))
-            pygame.draw.rect(self.image, eye_color, (w*0.7-6, h*0.4, 6, 6))
+        self.image = sprite_cache.get_image("enemy", self.type, self.color)
 
     def update(self):
         self.pos_y += self.speed
         
         # Wiggle motion
-        self.pos_x += math.sin(pygame.time.get_ticks() / 200.0 + self.pos_y) * 2
+        self.pos_x += math.sin(get_ticks() / 200.0 + self.pos_y) * 2
         
         self.rect.y = int(self.pos_y)
         self.rect.x = int(self.pos_x)
         
-        self.shoot_timer -= 1
-        
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
 
     def shoot(self):
-        if self.shoot_timer <= 0:
-            bullet_speed = 6 + (self.difficulty - 1) * 1.5
-            bullet = EnemyBullet(self.rect.centerx, self.rect.bottom, bullet_speed, self.color)
-            globals.all_sprites.add(bullet)
-            globals.enemy_bullets.add(bullet)
-            
-            base_rate = 60 if self.type == "normal" else 40
-            self.shoot_timer = random.randint(max(20, int(base_rate / self.difficulty)), max(40, int(base_rate*2 / self.difficulty)))
-            play_sound("enemy_shoot")
+        # Called by the enemy_fire scheduler on the tick this enemy is due
+        bullet_speed = 6 + (self.difficulty - 1) * 1.5
+        projectiles.enemy_bullets.spawn(self.rect.centerx, self.rect.bottom, 0, bullet_speed, self.color, self.uid)
+        
+        base_rate = 60 if self.type == "normal" else 40
+        delay = globals.rng.randint(max(20, int(base_rate / self.difficulty)), max(40, int(base_rate*2 / self.difficulty)))
+        enemy_fire.schedule(self, globals.tick + delay)
+        play_sound("enemy_shoot")
+
+@sprite_cache.register("powerup")
+def build_powerup_image(power_type):
+    image = pygame.Surface((24, 24), pygame.SRCALPHA)
+    
+    # Draw Cross
+    color = NEON_GREEN
+    pygame.draw.rect(image, color, (8, 0, 8, 24))
+    pygame.draw.rect(image, color, (0, 8, 24, 8))
+    pygame.draw.rect(image, WHITE, (0, 0, 24, 24), 2)
+    return image
 
 class PowerUp(pygame.sprite.Sprite):
     def __init__(self, x, y, power_type):
         super().__init__()
         self.power_type = power_type
-        self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
-        
-        # Draw Cross
-        color = NEON_GREEN
-        pygame.draw.rect(self.image, color, (8, 0, 8, 24))
-        pygame.draw.rect(self.image, color, (0, 8, 24, 8))
-        pygame.draw.rect(self.image, WHITE, (0, 0, 24, 24), 2)
+        self.image = sprite_cache.get_image("powerup", power_type)
         
         self.rect = self.image.get_rect(center=(x,y))
         self.speed = 3
@@ -259,6 +240,6 @@ class PowerUp(pygame.sprite.Sprite):
     def update(self):
         self.rect.y += self.speed
         # Pulse size
-        scale = 1.0 + 0.1 * math.sin(pygame.time.get_ticks() / 100.0)
+        scale = 1.0 + 0.1 * math.sin(get_ticks() / 100.0)
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
@@ -0,0 +1,25 @@
+from . import sprite_cache
+
+class FrameBank:
+    # Pre-rendered frames for a procedurally drawn image whose look depends on
+    # one continuous parameter. The parameter is quantized to `steps` evenly
+    # spaced values between lo and hi; frames come from the sprite cache builder
+    # registered under `kind`, which receives the quantized value.
+    def __init__(self, kind, lo, hi, steps):
+        self.kind = kind
+        self.lo = lo
+        self.hi = hi
+        self.steps = steps
+        self.frames = None
+
+    def value_at(self, index):
+        return self.lo + (self.hi - self.lo) * index / (self.steps - 1)
+
+    def build(self):
+        self.frames = [sprite_cache.get_image(self.kind, self.value_at(i)) for i in range(self.steps)]
+
+    def get(self, value):
+        if self.frames is None:
+            self.build()
+        index = round((value - self.lo) / (self.hi - self.lo) * (self.steps - 1))
+        return self.frames[max(0, min(self.steps - 1, index))]
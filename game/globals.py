@@ -1,11 +1,11 @@
 import pygame
+import random
 from .constants import Difficulty, GameState
 
 # Sprite Groups
 all_sprites = pygame.sprite.Group()
 enemies = pygame.sprite.Group()
 bullets = pygame.sprite.Group()
-enemy_bullets = pygame.sprite.Group()
 powerups = pygame.sprite.Group()
 particles = pygame.sprite.Group()
 
@@ -15,17 +15,22 @@ score = 0
 wave = 1
 high_score = 0
 games_played = 0
-enemy_spawn_timer = 0
 game_state = GameState.MENU
 game_time = 0.0
-last_frame_time = 0
+rng = random.Random() # All gameplay randomness; reseeded per run by core.start_game()
+run_seed = 0
+tick = 0 # Simulation steps since the run started
+sim_ticks = 0.0 # Simulation clock in ms since the run started, advanced by core.step()
+run_kills = {} # Enemy type -> kills this run
+run_damage = 0
+prev_positions = {} # Sprite -> topleft before the latest step, for interpolation
+frame_dt = 0.0 # Wall time of the last rendered frame in seconds
 # Management Data
 game_data = {}
 current_difficulty = Difficulty.NORMAL
 
 # Audio
 sounds = {}
-background_music = None
 music_volume = 0.3
 sfx_volume = 0.3
 
@@ -33,15 +38,20 @@ sfx_volume = 0.3
 buttons = []
 settings_buttons = []
 stats_buttons = []
+stats_summary = None # Run history aggregates, refreshed when STATS opens
 pause_buttons = []
 game_over_buttons = []
 controls_buttons = []
 
 # Background
-stars = []
+renderer = None # Active backend from game.renderer
+starfield = None
+frozen_backdrop = None # Snapshot reused while PAUSED / GAME_OVER
+frozen_state = None
 
 # Control
 should_quit = False
+save_enabled = True
 
 # Fonts (Initialized later)
 font_sm = None
@@ -53,12 +63,10 @@ font_xl = None
 shake_offset = [0, 0]
 shake_intensity = 0
 
-def init_fonts():
+def init_fonts(font_path=None):
+    # font_path comes from startup.resolve_font_path(); None uses pygame's default font
     global font_sm, font_md, font_lg, font_xl
-    try:
-        FONT_NAME = pygame.font.match_font('consolas', 'couriernew', 'monospace')
-    except:
-        FONT_NAME = None
+    FONT_NAME = font_path
     
     font_sm = pygame.font.Font(FONT_NAME, 20)
     font_md = pygame.font.Font(FONT_NAME, 32)
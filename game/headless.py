@@ -0,0 +1,168 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+# Headless soak/profiling run: dummy SDL drivers, fixed steps back to back, no frame cap.
+#   python -m game.headless --seconds 120 --input random --difficulty NIGHTMARE
+#   python main.py --headless ...
+#   python -m game.headless --replay run.rpl   (verify a recording as fast as possible)
+
+def idle_script(rng):
+    while True:
+        yield 0, False
+
+def sweep_script(rng):
+    tick = 0
+    while True:
+        move = 1 if (tick // 120) % 2 else -1
+        yield move, tick % 12 == 0
+        tick += 1
+
+def random_script(rng):
+    move = 0
+    while True:
+        if rng.random() < 1 / 30:
+            move = rng.choice((-1, 0, 1))
+        yield move, rng.random() < 0.2
+
+INPUT_SCRIPTS = {
+    "idle": idle_script,
+    "sweep": sweep_script,
+    "random": random_script,
+}
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="game.headless", description="Run the simulation without a display.")
+    parser.add_argument("--headless", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--seconds", type=float, default=60.0, help="simulated seconds to run")
+    parser.add_argument("--input", choices=sorted(INPUT_SCRIPTS), default="random", help="input script")
+    parser.add_argument("--difficulty", default="NORMAL", help="EASY, NORMAL, HARD, EXTREME or NIGHTMARE")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed")
+    parser.add_argument("--render", action="store_true", help="also draw every tick to an offscreen surface")
+    parser.add_argument("--audio", action="store_true", help="synthesize sounds (played on the dummy driver)")
+    parser.add_argument("--profile", metavar="CSV", help="write per-tick section timings to a CSV trace")
+    parser.add_argument("--record", metavar="DIR", help="save every run as a replay file in DIR")
+    parser.add_argument("--replay", metavar="FILE", help="play back a recording instead of an input script")
+    parser.add_argument("--timeline", metavar="FILE", help="wave timeline to use instead of the default")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    import pygame
+    pygame.init()
+
+    from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, SIM_FPS, GameState, Difficulty
+    from . import globals
+    from . import audio
+    from . import core
+    from . import data
+    from . import debug
+    from . import inputs
+    from . import replay
+    from . import ui
+    from .starfield import Starfield
+    from .profiler import profiler
+    from .timeline import waves
+
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    globals.init_fonts()
+    globals.starfield = Starfield()
+    if args.audio:
+        audio.load_all_sounds()
+
+    try:
+        globals.current_difficulty = Difficulty[args.difficulty.upper()]
+    except KeyError:
+        print(f"Unknown difficulty: {args.difficulty}")
+        return 2
+
+    # Never touch the player's save file from a soak run
+    globals.save_enabled = False
+    data.load_game_data()
+
+    if args.profile:
+        profiler.record_to(args.profile)
+    if args.timeline:
+        waves.path = args.timeline
+    if args.record:
+        replay.start_recording(args.record)
+
+    if args.replay:
+        try:
+            recording = replay.Recording.load(args.replay)
+            replay.start_playback(recording)
+        except (OSError, ValueError) as e:
+            print(f"Cannot replay {args.replay}: {e}")
+            return 2
+        seed = recording.seed
+        total_ticks = len(recording)
+    else:
+        seed = args.seed if args.seed is not None else random.randrange(2**32)
+        script = INPUT_SCRIPTS[args.input](random.Random(seed))
+        total_ticks = int(args.seconds * SIM_FPS)
+        core.start_game(seed)
+
+    runs = 1
+    peaks = {}
+    start = time.perf_counter()
+    tick_start = start
+    for _ in range(total_ticks):
+        if not args.replay:
+            move, fire = next(script)
+            inputs.scripted_move = move
+            if fire:
+                inputs.request_fire()
+
+        with profiler.section("update"):
+            core.step()
+
+        if args.render:
+            with profiler.section("background"):
+                screen.fill((0, 0, 0))
+            ui.draw_playing(screen)
+
+        for name, count in debug.entity_counts().items():
+            if count > peaks.get(name, 0):
+                peaks[name] = count
+
+        if args.replay:
+            if replay.playback.done:
+                break
+        elif globals.game_state == GameState.GAME_OVER:
+            # Each later run gets its own seed, still derived from the first
+            runs += 1
+            core.start_game(seed + runs - 1)
+
+        now = time.perf_counter()
+        profiler.end_frame(now - tick_start)
+        tick_start = now
+    elapsed = time.perf_counter() - start
+    ticks = total_ticks
+
+    verified = True
+    if args.replay:
+        ticks = replay.playback.tick
+        verified = replay.finish_playback()
+    replay.stop_recording()
+
+    inputs.reset()
+    print(f"Simulated {ticks} ticks ({ticks / SIM_FPS:.0f}s) in {elapsed:.2f}s wall time")
+    print(f"Ticks per second: {ticks / elapsed:.0f} ({ticks / elapsed / SIM_FPS:.1f}x real time)")
+    source = f"replay: {args.replay}" if args.replay else f"input: {args.input}"
+    print(f"Seed: {seed}, difficulty: {globals.current_difficulty.name}, {source}, runs: {runs}")
+    print("Peak entities: " + ", ".join(f"{k} {v}" for k, v in peaks.items()))
+    debug.print_stats()
+    if args.profile:
+        profiler.dump_csv()
+
+    pygame.quit()
+    return 0 if verified else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
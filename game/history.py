@@ -0,0 +1,134 @@
+import sqlite3
+import threading
+from .constants import HISTORY_TOP_RUNS, HISTORY_TREND_RUNS
+
+# Every finished run is one row. Per-difficulty totals are kept up to date
+# by a trigger, so the STATS aggregates never scan the runs table; top runs
+# and recent trends walk the (difficulty, score) and (difficulty, played_at)
+# indexes and only touch a handful of rows.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    played_at REAL NOT NULL,
+    difficulty TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    wave INTEGER NOT NULL,
+    damage_taken INTEGER NOT NULL,
+    UNIQUE (played_at, seq)
+);
+CREATE TABLE IF NOT EXISTS run_kills (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    enemy_type TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, enemy_type)
+);
+CREATE TABLE IF NOT EXISTS difficulty_totals (
+    difficulty TEXT PRIMARY KEY,
+    runs INTEGER NOT NULL,
+    score_sum INTEGER NOT NULL,
+    best INTEGER NOT NULL,
+    duration_sum REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_difficulty_score ON runs (difficulty, score DESC);
+CREATE INDEX IF NOT EXISTS idx_runs_difficulty_date ON runs (difficulty, played_at);
+CREATE INDEX IF NOT EXISTS idx_runs_score ON runs (score DESC);
+CREATE TRIGGER IF NOT EXISTS runs_totals AFTER INSERT ON runs BEGIN
+    INSERT OR IGNORE INTO difficulty_totals VALUES (NEW.difficulty, 0, 0, 0, 0);
+    UPDATE difficulty_totals SET
+        runs = runs + 1,
+        score_sum = score_sum + NEW.score,
+        best = MAX(best, NEW.score),
+        duration_sum = duration_sum + NEW.duration
+    WHERE difficulty = NEW.difficulty;
+END;
+"""
+
+class RunHistory:
+    # Writes come from the save writer thread, reads from the main thread;
+    # each thread gets its own connection and WAL keeps them from blocking.
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.version = 0 # Bumped after every committed run
+        self.summary_cache = None
+        self.summary_version = -1
+        self.queries = 0
+
+    def connect(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self.local.conn = conn
+        return conn
+
+    def record(self, records):
+        # Duplicates (a journal replayed after a crash) are ignored by the
+        # UNIQUE constraint and never reach the totals trigger
+        conn = self.connect()
+        added = 0
+        with conn:
+            for r in records:
+                cur = conn.execute(
+                    "INSERT OR IGNORE INTO runs (seq, played_at, difficulty, score, duration, wave, damage_taken) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (r["seq"], r.get("played_at", 0.0), r["difficulty"], r["score"],
+                     r.get("duration", 0.0), r.get("wave", 1), r.get("damage", 0)))
+                if cur.rowcount == 0:
+                    continue
+                conn.executemany(
+                    "INSERT INTO run_kills (run_id, enemy_type, count) VALUES (?, ?, ?)",
+                    [(cur.lastrowid, kind, n) for kind, n in r.get("kills", {}).items()])
+                added += 1
+        if added:
+            self.version += 1
+        return added
+
+    def summary(self, difficulty):
+        # Memoized until the next run is committed (or the difficulty changes)
+        key = (self.version, difficulty)
+        if self.summary_cache is not None and self.summary_version == key:
+            return self.summary_cache
+        self.summary_cache = self._query(difficulty)
+        self.summary_version = key
+        return self.summary_cache
+
+    def _query(self, difficulty):
+        self.queries += 1
+        conn = self.connect()
+        totals = {}
+        for name, runs, score_sum, best, duration_sum in conn.execute(
+                "SELECT difficulty, runs, score_sum, best, duration_sum FROM difficulty_totals"):
+            totals[name] = {
+                "runs": runs,
+                "best": best,
+                "avg_score": score_sum / runs,
+                "avg_duration": duration_sum / runs,
+            }
+
+        top = conn.execute(
+            "SELECT score, wave, duration, played_at FROM runs WHERE difficulty = ? "
+            "ORDER BY score DESC LIMIT ?", (difficulty, HISTORY_TOP_RUNS)).fetchall()
+
+        recent = [row[0] for row in conn.execute(
+            "SELECT score FROM runs WHERE difficulty = ? ORDER BY played_at DESC LIMIT ?",
+            (difficulty, HISTORY_TREND_RUNS * 2))]
+        trend = None
+        if len(recent) > HISTORY_TREND_RUNS:
+            last = recent[:HISTORY_TREND_RUNS]
+            before = recent[HISTORY_TREND_RUNS:]
+            trend = sum(last) / len(last) - sum(before) / len(before)
+
+        kills = dict(conn.execute(
+            "SELECT k.enemy_type, SUM(k.count) FROM run_kills k JOIN runs r ON r.id = k.run_id "
+            "WHERE r.id IN (SELECT id FROM runs WHERE difficulty = ? ORDER BY played_at DESC LIMIT ?) "
+            "GROUP BY k.enemy_type", (difficulty, HISTORY_TREND_RUNS)).fetchall())
+
+        return {"totals": totals, "top": top, "trend": trend, "recent_kills": kills}
+
+    def stats(self):
+        return {"version": self.version, "queries": self.queries}
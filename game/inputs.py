@@ -0,0 +1,44 @@
+import pygame
+
+# Scripted input replaces the keyboard when set (headless runs).
+# It is the horizontal axis: -1 left, 0 idle, 1 right.
+scripted_move = None
+fire_requested = False
+
+# What the current tick sees, sampled once by begin_tick() so that
+# recordings capture exactly the input the simulation used
+tick_move = 0
+tick_fire = False
+
+def get_move():
+    if scripted_move is not None:
+        return scripted_move
+    keys = pygame.key.get_pressed()
+    dx = 0
+    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        dx = -1
+    if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        dx = 1
+    return dx
+
+def request_fire():
+    global fire_requested
+    fire_requested = True
+
+def consume_fire():
+    global fire_requested
+    fired = fire_requested
+    fire_requested = False
+    return fired
+
+def begin_tick():
+    global tick_move, tick_fire
+    tick_move = get_move()
+    tick_fire = consume_fire()
+
+def reset():
+    global scripted_move, fire_requested, tick_move, tick_fire
+    scripted_move = None
+    fire_requested = False
+    tick_move = 0
+    tick_fire = False
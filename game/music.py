@@ -0,0 +1,122 @@
+import time
+import threading
+import numpy as np
+import pygame
+from .constants import GameState, MUSIC_CHUNK_BEATS
+from . import globals
+
+# Background music is synthesized a couple of beats at a time on a worker
+# thread and queued on the dedicated music channel, so memory stays at
+# roughly two chunks no matter how long the session runs.
+SAMPLE_RATE = 44100
+BEAT_FRAMES = 33075 # 0.75 s, 16 beats per 12 s loop
+ARP_FRAMES = BEAT_FRAMES // 2
+LOOP_BEATS = 16
+
+BASS_FREQS = np.array([110, 110, 130.8, 98]) # A2, A2, C3, G2
+ARP_FREQS = np.array([440, 554, 659, 880])
+
+# Arrangement levels:
+# 0 bass + hats, 1 adds arpeggios, 2 hats on every beat, 3 octave bass
+MAX_INTENSITY = 3
+
+def render_chunk(first_beat, beats, intensity, rng):
+    n = beats * BEAT_FRAMES
+    idx = np.arange(n)
+    pos = idx % BEAT_FRAMES
+    beat = first_beat + idx // BEAT_FRAMES
+    in_beat = pos / SAMPLE_RATE
+    # Phase restarts every loop, exactly like the old fixed 12 s track
+    t = ((beat % LOOP_BEATS) * BEAT_FRAMES + pos) / SAMPLE_RATE
+
+    # Cyberpunk Bass Line
+    bass_f = BASS_FREQS[(beat // 4) % 4]
+    pluck = np.exp(-3 * in_beat) # Pluck envelope
+    wave = np.sign(np.sin(2 * np.pi * bass_f * t)) * 0.5 * pluck # Square bass
+    if intensity >= 3:
+        wave += np.sign(np.sin(4 * np.pi * bass_f * t)) * 0.15 * pluck
+
+    # Hi-hats
+    hat_beats = np.ones(n, dtype=bool) if intensity >= 2 else (beat % 2 == 0)
+    noise = rng.uniform(-0.1, 0.1, n) * np.exp(-20 * in_beat)
+    wave += noise * hat_beats
+
+    # Arpeggios, two per beat
+    if intensity >= 1:
+        second_half = pos >= ARP_FRAMES
+        arp = beat * 2 + second_half
+        in_arp = np.where(second_half, pos - ARP_FRAMES, pos) / SAMPLE_RATE
+        arp_f = ARP_FREQS[arp % 4] * np.where(arp % 8 > 4, 1.5, 1.0) # Variation
+        wave += np.sin(2 * np.pi * arp_f * t) * 0.1 * np.exp(-5 * in_arp)
+
+    wave = (wave * 32767 * 0.2).astype(np.int16)
+    return np.column_stack((wave, wave))
+
+class MusicStream:
+    def __init__(self):
+        self.channel = None
+        self.thread = None
+        self.running = False
+        self.volume = 0.3
+        self.intensity = 1
+        self.beat = 0
+        self.rng = np.random.default_rng()
+        self.live = [] # Sounds playing or queued, for volume changes
+        self.chunks = 0
+
+    def start(self, channel, volume):
+        if self.running or channel is None:
+            return
+        self.channel = channel
+        self.volume = volume
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="music-stream", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+        if self.channel is not None:
+            self.channel.stop()
+
+    def set_volume(self, volume):
+        self.volume = volume
+        for sound in list(self.live):
+            sound.set_volume(volume)
+
+    def set_intensity(self, level):
+        self.intensity = max(0, min(MAX_INTENSITY, level))
+
+    def _run(self):
+        while self.running:
+            # Synthesize ahead while the current chunk plays
+            samples = render_chunk(self.beat, MUSIC_CHUNK_BEATS, self.intensity, self.rng)
+            sound = pygame.sndarray.make_sound(samples)
+            sound.set_volume(self.volume)
+            self.beat += MUSIC_CHUNK_BEATS
+
+            while self.running and self.channel.get_queue() is not None:
+                time.sleep(0.01)
+            if not self.running:
+                break
+            if self.channel.get_busy():
+                self.channel.queue(sound)
+            else:
+                self.channel.play(sound)
+            self.live = self.live[-1:] + [sound]
+            self.chunks += 1
+
+stream = MusicStream()
+
+def update_intensity():
+    # Arrangement follows the game: calmer when paused, busier with waves and crowds
+    state = globals.game_state
+    if state == GameState.PAUSED:
+        level = 0
+    elif state == GameState.PLAYING:
+        level = 1 + (globals.wave >= 2) + (len(globals.enemies) >= 12)
+    else:
+        level = 1
+    stream.set_intensity(level)
@@ -0,0 +1,117 @@
+import os
+import json
+import time
+import math
+from collections import deque
+import pygame
+from .constants import PACING_MODES, PACING_RATES, PACING_DEFAULT, PACING_WINDOW, PACING_MISS_TOLERANCE
+from . import data
+
+# How the main loop waits between frames:
+#   capped    Clock.tick, sleeps so it's cheap but only accurate to a ms or two
+#   busy      Clock.tick_busy_loop, spins for the last stretch, precise but burns a core
+#   vsync     the display is opened with vsync and flip waits for the refresh;
+#             falls back to capped if the driver refuses vsync
+#   uncapped  as fast as it will go, to measure headroom
+# The setting is kept in its own small file so it is known before the
+# display opens, which vsync needs.
+PACING_FILE_NAME = "pacing.json"
+
+class Pacer:
+    def __init__(self):
+        self.mode, self.rate = PACING_DEFAULT
+        self.clock = pygame.time.Clock()
+        self.vsync_active = False # Whether the current display actually has vsync
+        self.last = None
+        self.times = deque(maxlen=PACING_WINDOW)
+        self.frames = 0
+        self.missed = 0
+
+    @property
+    def interval_ms(self):
+        return 1000.0 / self.rate
+
+    @property
+    def needs_restart(self):
+        # vsync is decided when the display opens
+        return self.mode == "vsync" and not self.vsync_active
+
+    def tick(self):
+        # Waits out the frame and returns its wall time in seconds
+        if self.mode == "busy":
+            self.clock.tick_busy_loop(self.rate)
+        elif self.mode == "capped" or self.needs_restart:
+            self.clock.tick(self.rate)
+        else:
+            self.clock.tick()
+
+        now = time.perf_counter()
+        dt = 0.0 if self.last is None else now - self.last
+        self.last = now
+        if dt > 0.0:
+            frame_ms = dt * 1000.0
+            self.times.append(frame_ms)
+            self.frames += 1
+            if frame_ms > self.interval_ms * (1.0 + PACING_MISS_TOLERANCE):
+                self.missed += 1
+        return dt
+
+    def reset_stats(self):
+        self.times.clear()
+        self.frames = 0
+        self.missed = 0
+
+    # --- Settings ---
+    def set(self, mode=None, rate=None):
+        if mode in PACING_MODES:
+            self.mode = mode
+        if rate:
+            self.rate = max(1, int(rate))
+        self.reset_stats()
+
+    def cycle_mode(self, direction):
+        idx = PACING_MODES.index(self.mode) if self.mode in PACING_MODES else 0
+        self.set(mode=PACING_MODES[(idx + direction) % len(PACING_MODES)])
+        self.save()
+
+    def cycle_rate(self, direction):
+        rates = list(PACING_RATES)
+        if self.rate not in rates:
+            rates = sorted(rates + [self.rate])
+        idx = rates.index(self.rate)
+        self.set(rate=rates[max(0, min(len(rates) - 1, idx + direction))])
+        self.save()
+
+    def path(self):
+        return os.path.join(data.save_dir, PACING_FILE_NAME)
+
+    def load(self):
+        try:
+            with open(self.path(), "r") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.set(saved.get("mode"), saved.get("rate"))
+
+    def save(self):
+        try:
+            os.makedirs(data.save_dir, exist_ok=True)
+            with open(self.path(), "w") as f:
+                json.dump({"mode": self.mode, "rate": self.rate}, f)
+        except OSError as e:
+            print(f"Could not save pacing setting: {e}")
+
+    # --- Stats ---
+    def stats(self):
+        times = list(self.times)
+        if not times:
+            mean = std = jitter = 0.0
+        else:
+            mean = sum(times) / len(times)
+            std = math.sqrt(sum((t - mean) ** 2 for t in times) / len(times))
+            # Mean change between consecutive frames, what stutter looks like
+            jitter = sum(abs(b - a) for a, b in zip(times, times[1:])) / max(1, len(times) - 1)
+        return {"mode": self.mode, "rate": self.rate, "vsync": self.vsync_active, "mean_ms": mean,
+                "std_ms": std, "jitter_ms": jitter, "frames": self.frames, "missed": self.missed}
+
+pacer = Pacer()
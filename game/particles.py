@@ -1,59 +1,142 @@
 import pygame
-import random
 import math
-from . import globals
+import numpy as np
+from .constants import MAX_PARTICLES, PARTICLE_ALPHA_LEVELS
 from .utils import add_shake
+from . import globals
+from . import sprite_cache
+from .pool import Pool, PooledSprite
 
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, x, y, color, speed_range=(2, 6), life_range=(20, 40), size_range=(2,6)):
-        super().__init__()
-        self.color = color
-        self.size = random.randint(*size_range)
-        self.image = pygame.Surface((self.size*2, self.size*2), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=(x, y))
-        self.pos_x = float(x)
-        self.pos_y = float(y)
-        
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(*speed_range)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        self.life = random.randint(*life_range)
-        self.original_life = self.life
+class ParticleSystem:
+    # All explosion particles live in preallocated arrays. Live particles are
+    # always packed into the first `count` slots so every step is a slice op.
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0
+        self.peak = 0
+        self.rng = np.random.default_rng()
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev_pos = np.zeros((capacity, 2), dtype=np.float64) # For render interpolation
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.max_life = np.ones(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32) # Index into palette
+        self.size = np.zeros(capacity, dtype=np.int32)
+
+        self.palette = []
+        self.palette_index = {}
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, color, count, speed_range=(2, 6), life_range=(20, 40), size_range=(2, 6)):
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        start, end = self.count, self.count + count
+
+        rgb = tuple(color[:3])
+        if rgb not in self.palette_index:
+            self.palette_index[rgb] = len(self.palette)
+            self.palette.append(rgb)
+
+        angle = self.rng.uniform(0, 2 * math.pi, count)
+        speed = self.rng.uniform(speed_range[0], speed_range[1], count)
+        self.pos[start:end] = (x, y)
+        self.prev_pos[start:end] = (x, y)
+        self.vel[start:end, 0] = np.cos(angle) * speed
+        self.vel[start:end, 1] = np.sin(angle) * speed
+        # Inclusive ranges, same as random.randint
+        self.life[start:end] = self.rng.integers(life_range[0], life_range[1] + 1, count)
+        self.max_life[start:end] = self.life[start:end]
+        self.size[start:end] = self.rng.integers(size_range[0], size_range[1] + 1, count)
+        self.color[start:end] = self.palette_index[rgb]
+
+        self.count = end
+        self.peak = max(self.peak, self.count)
 
     def update(self):
-        self.pos_x += self.vx
-        self.pos_y += self.vy
-        self.rect.centerx = int(self.pos_x)
-        self.rect.centery = int(self.pos_y)
-        
-        self.vx *= 0.95 # Drag
-        self.vy *= 0.95
-        self.life -= 1
-        
-        if self.life <= 0:
-            self.kill()
-        else:
-            # Re-draw with alpha
-            alpha = int(255 * (self.life / self.original_life))
-            self.image.fill((0,0,0,0)) # Clear
-            
-            # Glow effect
-            rgb = self.color[:3]
-            pygame.draw.circle(self.image, (*rgb, alpha), (self.size, self.size), self.size)
-
-class TrailParticle(pygame.sprite.Sprite):
-    def __init__(self, x, y, color):
-        super().__init__()
+        n = self.count
+        if n == 0:
+            return
+        self.prev_pos[:n] = self.pos[:n]
+        self.pos[:n] += self.vel[:n]
+        self.vel[:n] *= 0.95 # Drag
+        self.life[:n] -= 1
+
+        alive = self.life[:n] > 0
+        if alive.all():
+            return
+        # Compact survivors to the front of the arrays
+        idx = np.flatnonzero(alive)
+        k = len(idx)
+        for arr in (self.pos, self.prev_pos, self.vel, self.life, self.max_life, self.color, self.size):
+            arr[:k] = arr[idx]
+        self.count = k
+
+    def screen_positions(self, offset, alpha):
+        # Top-lefts as int32 arrays; alpha blends between the previous and current sim step
+        n = self.count
+        size = self.size[:n]
+        pos = self.prev_pos[:n] + (self.pos[:n] - self.prev_pos[:n]) * alpha
+        xs = pos[:, 0].astype(np.int32) - size + int(offset[0])
+        ys = pos[:, 1].astype(np.int32) - size + int(offset[1])
+        return xs, ys
+
+    def images(self, idx):
+        # Cached image for each particle in idx
+        levels = (self.life[idx] * (PARTICLE_ALPHA_LEVELS - 1)) // self.max_life[idx]
+        get_image = sprite_cache.get_image
+        palette = self.palette
+        return [get_image("particle", palette[c], s, a) for c, s, a in
+                zip(self.color[idx].tolist(), self.size[idx].tolist(), levels.tolist())]
+
+    def draw(self, surface, offset=(0, 0), alpha=1.0):
+        n = self.count
+        if n == 0:
+            return
+        xs, ys = self.screen_positions(offset, alpha)
+        surface.blits(list(zip(self.images(np.arange(n)), zip(xs.tolist(), ys.tolist()))), doreturn=False)
+
+    def submit(self, queue, offset=(0, 0), alpha=1.0):
+        n = self.count
+        if n == 0:
+            return
+        xs, ys = self.screen_positions(offset, alpha)
+        extent = self.size[:n] * 2
+        queue.submit_arrays("particles", xs, ys, extent, extent, self.images)
+
+    def stats(self):
+        return {"live": self.count, "peak": self.peak, "capacity": self.capacity}
+
+system = ParticleSystem()
+
+@sprite_cache.register("particle")
+def build_particle_image(color, size, level):
+    alpha = int(255 * level / (PARTICLE_ALPHA_LEVELS - 1))
+    image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(image, (*color, alpha), (size, size), size)
+    return image
+
+@sprite_cache.register("trail")
+def build_trail_image(color, life, original_life):
+    alpha = int(200 * (life / original_life))
+    image = pygame.Surface((6, 6), pygame.SRCALPHA)
+    pygame.draw.circle(image, (*color, alpha), (3, 3), 2)
+    return image
+
+class TrailParticle(PooledSprite):
+    def reset(self, x, y, color):
         self.color = color
-        self.image = pygame.Surface((6, 6), pygame.SRCALPHA)
+        self.image = sprite_cache.get_image("trail", color, 0, 15)
         self.rect = self.image.get_rect(center=(x, y))
         self.pos_x = float(x)
         self.pos_y = float(y)
         self.life = 15
         self.original_life = 15
-        self.vy = random.uniform(1, 3)
-        self.vx = random.uniform(-0.5, 0.5)
+        self.vy = globals.rng.uniform(1, 3)
+        self.vx = globals.rng.uniform(-0.5, 0.5)
 
     def update(self):
         self.pos_y += self.vy
@@ -63,14 +146,11 @@ class TrailParticle(pygame.sprite.Sprite):
         self.life -= 1
         if self.life <= 0:
             self.kill()
-        
-        alpha = int(200 * (self.life / self.original_life))
-        self.image.fill((0,0,0,0))
-        pygame.draw.circle(self.image, (*self.color, alpha), (3, 3), 2)
+
+        self.image = sprite_cache.get_image("trail", self.color, max(self.life, 0), self.original_life)
+
+TrailParticle.pool = Pool(TrailParticle)
 
 def create_explosion(x, y, color, count=15):
     add_shake(4)
-    for _ in range(count):
-        p = Particle(x, y, color)
-        globals.all_sprites.add(p)
-        globals.particles.add(p)
+    system.emit(x, y, color, count)
@@ -0,0 +1,65 @@
+import pygame
+from .constants import POOL_MAX_SIZE
+
+all_pools = []
+
+class Pool:
+    # Bounded free-list of dead sprites waiting to be reinitialized
+    def __init__(self, cls, max_size=POOL_MAX_SIZE):
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.high_water = 0 # Most objects ever parked in the free-list
+        all_pools.append(self)
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.cls(*args)
+            self.created += 1
+        return obj
+
+    def release(self, obj):
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+            self.high_water = max(self.high_water, len(self.free))
+        else:
+            self.discarded += 1
+
+    def stats(self):
+        total = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "reuse_rate": self.reused / total if total else 0.0,
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "discarded": self.discarded,
+        }
+
+class PooledSprite(pygame.sprite.Sprite):
+    # Subclasses set `pool` and implement reset() with the __init__ arguments
+    pool = None
+
+    def __init__(self, *args):
+        super().__init__()
+        self.reset(*args)
+
+    @classmethod
+    def spawn(cls, *args):
+        return cls.pool.acquire(*args)
+
+    def kill(self):
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+def stats():
+    return {p.cls.__name__: p.stats() for p in all_pools}
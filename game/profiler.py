@@ -0,0 +1,157 @@
+import csv
+import time
+from collections import deque
+import pygame
+from .constants import *
+from . import globals
+from . import debug
+
+# Sections in display order; indented ones are nested inside the one above.
+# Update sections accumulate over every sim step taken in a frame. While
+# PLAYING, background, sprites and hud time submitting to the render queue
+# and flush times drawing it.
+SECTIONS = ("events", "update", "movement", "spawn", "shoot", "collisions",
+            "background", "sprites", "hud", "flush", "ui", "overlay", "flip")
+NESTED = ("movement", "spawn", "shoot", "collisions")
+
+class Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter() if self.profiler.active else None
+
+    def __exit__(self, *exc):
+        if self.start is not None:
+            self.profiler.current[self.name] += (time.perf_counter() - self.start) * 1000.0
+            self.start = None
+
+class Profiler:
+    # Rolling per-section timers. Nothing is measured unless the overlay is
+    # showing or a trace is being recorded.
+    def __init__(self):
+        self.overlay = False
+        self.recording = False
+        self.trace_path = None
+        self.sections = {name: Section(self, name) for name in SECTIONS}
+        self.current = dict.fromkeys(SECTIONS, 0.0)
+        self.window = {name: deque(maxlen=PROFILER_WINDOW) for name in SECTIONS}
+        self.frame_times = deque(maxlen=PROFILER_WINDOW)
+        self.trace = deque(maxlen=PROFILER_TRACE_MAX)
+        self.frame = 0
+        self.start = time.perf_counter()
+        self.surface = None
+        self.last_refresh = 0.0
+
+    @property
+    def active(self):
+        return self.overlay or self.recording
+
+    def section(self, name):
+        return self.sections[name]
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        self.surface = None
+
+    def record_to(self, path):
+        self.recording = True
+        self.trace_path = path
+
+    def end_frame(self, frame_dt):
+        if not self.active:
+            return
+        frame_ms = frame_dt * 1000.0
+        self.frame_times.append(frame_ms)
+        for name in SECTIONS:
+            self.window[name].append(self.current[name])
+        counts = debug.frame_counts()
+        self.trace.append([self.frame, round((time.perf_counter() - self.start) * 1000.0, 3), round(frame_ms, 3)]
+                          + [round(self.current[name], 4) for name in SECTIONS]
+                          + list(counts.values()))
+        self.frame += 1
+        self.current = dict.fromkeys(SECTIONS, 0.0)
+
+    def percentiles(self):
+        times = sorted(self.frame_times)
+        if not times:
+            return {}
+        pick = lambda p: times[min(len(times) - 1, int(len(times) * p))]
+        return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": times[-1]}
+
+    def dump_csv(self, path=None):
+        path = path or self.trace_path or time.strftime("profile_%Y%m%d_%H%M%S.csv")
+        header = ["frame", "t_ms", "frame_ms"] + [f"{name}_ms" for name in SECTIONS] + list(debug.frame_counts())
+        try:
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(self.trace)
+            print(f"Wrote {len(self.trace)} frames to {path}")
+        except OSError as e:
+            print(f"Could not write profile trace: {e}")
+        return path
+
+    # --- Overlay ---
+    def draw(self, screen):
+        if not self.overlay:
+            return
+        with self.section("overlay"):
+            # Text changes every frame, so the panel is rebuilt on a timer
+            # rather than each frame, and bypasses the shared text cache
+            now = time.perf_counter() * 1000.0
+            if self.surface is None or now - self.last_refresh >= PROFILER_REFRESH_MS:
+                self.surface = self.build_surface()
+                self.last_refresh = now
+            screen.blit(self.surface, (SCREEN_WIDTH - self.surface.get_width() - 10, 10))
+
+    def build_surface(self):
+        font = globals.font_sm
+        line_h = font.get_linesize()
+        lines = []
+
+        stats = self.percentiles()
+        if stats:
+            avg = sum(self.frame_times) / len(self.frame_times)
+            lines.append((f"FRAME {avg:5.2f} ms  {1000.0 / avg if avg else 0:5.0f} FPS", NEON_YELLOW))
+            lines.append((f"p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f}  max {stats['max']:.1f}", WHITE))
+
+        # Section rows are (label, value) pairs drawn in two columns
+        for name in SECTIONS:
+            samples = self.window[name]
+            avg = sum(samples) / len(samples) if samples else 0.0
+            label = ("  " + name) if name in NESTED else name
+            lines.append(((label, f"{avg:.3f} ms"), NEON_BLUE if name in NESTED else WHITE))
+
+        counts = list(debug.frame_counts().items())
+        for i in range(0, len(counts), 2):
+            lines.append((tuple(f"{k} {v}" for k, v in counts[i:i + 2]), NEON_GREEN))
+
+        width = 300
+        graph_h = 60
+        surf = pygame.Surface((width, len(lines) * line_h + graph_h + 20), pygame.SRCALPHA)
+        surf.fill((10, 10, 20, 200))
+        for i, (text, color) in enumerate(lines):
+            y = 6 + i * line_h
+            if isinstance(text, tuple):
+                for col, part in enumerate(text):
+                    surf.blit(font.render(part, True, color), (8 + col * 150, y))
+            else:
+                surf.blit(font.render(text, True, color), (8, y))
+
+        # Frame time graph, scaled so 2x the sim step fills the height
+        top = len(lines) * line_h + 12
+        scale = graph_h / (2000.0 / SIM_FPS)
+        budget_y = top + graph_h - int(1000.0 / SIM_FPS * scale)
+        pygame.draw.line(surf, NEON_RED, (8, budget_y), (width - 8, budget_y), 1)
+        if len(self.frame_times) > 1:
+            step = (width - 16) / (PROFILER_WINDOW - 1)
+            points = [(8 + i * step, top + graph_h - min(graph_h, ms * scale)) for i, ms in enumerate(self.frame_times)]
+            pygame.draw.lines(surf, NEON_GREEN, False, points, 1)
+        return surf
+
+profiler = Profiler()
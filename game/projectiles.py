@@ -0,0 +1,125 @@
+import pygame
+import numpy as np
+from .constants import SCREEN_HEIGHT, BLACK, WHITE, MAX_PROJECTILES, ENEMY_BULLET_SIZE
+from . import sprite_cache
+
+@sprite_cache.register("enemy_bullet")
+def build_enemy_bullet_image(color):
+    # Hard-edged, so a colorkey replaces per-pixel alpha; thousands are drawn per frame
+    image = pygame.Surface((10, 10))
+    image.fill(BLACK)
+    pygame.draw.circle(image, color, (5, 5), 4)
+    pygame.draw.circle(image, WHITE, (5, 5), 2)
+    image.set_colorkey(BLACK, pygame.RLEACCEL)
+    return image
+
+class ProjectileStore:
+    # Enemy bullets as packed arrays, laid out like particles.ParticleSystem.
+    # Positions are the top-left of a square ENEMY_BULLET_SIZE hitbox, so the
+    # rect test matches what the old per-bullet sprites did.
+    def __init__(self, capacity=MAX_PROJECTILES):
+        self.capacity = capacity
+        self.count = 0
+        self.peak = 0
+        self.dropped = 0
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.prev_pos = np.zeros((capacity, 2), dtype=np.float64) # For render interpolation
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.color = np.zeros(capacity, dtype=np.int32) # Index into palette
+        self.owner = np.zeros(capacity, dtype=np.int64) # uid of the enemy that fired
+
+        self.palette = []
+        self.palette_index = {}
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, centerx, top, vx, vy, color, owner=0):
+        i = self.count
+        if i >= self.capacity:
+            self.dropped += 1
+            return
+        rgb = tuple(color[:3])
+        if rgb not in self.palette_index:
+            self.palette_index[rgb] = len(self.palette)
+            self.palette.append(rgb)
+
+        x = centerx - ENEMY_BULLET_SIZE // 2
+        self.pos[i] = (x, top)
+        self.prev_pos[i] = (x, top)
+        self.vel[i] = (vx, vy)
+        self.color[i] = self.palette_index[rgb]
+        self.owner[i] = owner
+        self.count = i + 1
+        self.peak = max(self.peak, self.count)
+
+    def keep(self, alive):
+        # Compact the survivors in one pass; alive is a mask over [:count]
+        idx = np.flatnonzero(alive)
+        k = len(idx)
+        for arr in (self.pos, self.prev_pos, self.vel, self.color, self.owner):
+            arr[:k] = arr[idx]
+        self.count = k
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+        self.prev_pos[:n] = self.pos[:n]
+        self.pos[:n] += self.vel[:n]
+
+        # Cull once past the bottom edge, like the old sprites. Bullets above the
+        # top are kept unless they're heading up, since enemies still flying in
+        # from above the screen fire too.
+        y = self.pos[:n, 1].astype(np.int32)
+        alive = (y <= SCREEN_HEIGHT) & ((y > -ENEMY_BULLET_SIZE) | (self.vel[:n, 1] >= 0))
+        if not alive.all():
+            self.keep(alive)
+
+    def collide_rect(self, rect):
+        # Removes every bullet overlapping rect and returns how many there were
+        n = self.count
+        if n == 0:
+            return 0
+        pos = self.pos[:n].astype(np.int32)
+        x, y = pos[:, 0], pos[:, 1]
+        hit = ((x < rect.right) & (x + ENEMY_BULLET_SIZE > rect.left) &
+               (y < rect.bottom) & (y + ENEMY_BULLET_SIZE > rect.top))
+        hits = int(np.count_nonzero(hit))
+        if hits:
+            self.keep(~hit)
+        return hits
+
+    def screen_positions(self, offset, alpha):
+        n = self.count
+        pos = self.prev_pos[:n] + (self.pos[:n] - self.prev_pos[:n]) * alpha
+        xs = pos[:, 0].astype(np.int32) + int(offset[0])
+        ys = pos[:, 1].astype(np.int32) + int(offset[1])
+        return xs, ys
+
+    def images(self, idx):
+        # One shared image per color
+        palette = [sprite_cache.get_image("enemy_bullet", rgb) for rgb in self.palette]
+        return [palette[c] for c in self.color[idx].tolist()]
+
+    def draw(self, surface, offset=(0, 0), alpha=1.0):
+        n = self.count
+        if n == 0:
+            return
+        xs, ys = self.screen_positions(offset, alpha)
+        surface.blits(list(zip(self.images(np.arange(n)), zip(xs.tolist(), ys.tolist()))), doreturn=False)
+
+    def submit(self, queue, offset=(0, 0), alpha=1.0):
+        if self.count == 0:
+            return
+        xs, ys = self.screen_positions(offset, alpha)
+        queue.submit_arrays("projectiles", xs, ys, ENEMY_BULLET_SIZE, ENEMY_BULLET_SIZE, self.images)
+
+    def checksum_bytes(self):
+        return self.pos[:self.count].astype(np.int32).tobytes()
+
+    def stats(self):
+        return {"live": self.count, "peak": self.peak, "capacity": self.capacity, "dropped": self.dropped}
+
+enemy_bullets = ProjectileStore()
@@ -0,0 +1,56 @@
+import numpy as np
+import pygame
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_LAYERS
+
+class RenderQueue:
+    # Blits are submitted to named layers during a frame and culled against
+    # the screen as they arrive; flush draws each layer back to front with a
+    # single Surface.blits call.
+    def __init__(self, bounds=None):
+        self.bounds = bounds or pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.layers = {name: [] for name in RENDER_LAYERS}
+        self.submitted = 0
+        self.culled = 0
+        self.last = {"draw_calls": 0, "blits": 0, "culled": 0}
+
+    def submit(self, layer, image, pos):
+        self.submitted += 1
+        b = self.bounds
+        x, y = pos
+        w, h = image.get_size()
+        if x < b.right and y < b.bottom and x + w > b.left and y + h > b.top:
+            self.layers[layer].append((image, pos))
+        else:
+            self.culled += 1
+
+    def submit_many(self, layer, blits):
+        # Pre-built (image, pos) pairs that are known to be on screen
+        self.submitted += len(blits)
+        self.layers[layer].extend(blits)
+
+    def submit_arrays(self, layer, xs, ys, ws, hs, images):
+        # Array-backed batches: xs/ys are int32 top-lefts, ws/hs sizes (arrays
+        # or scalars) and images(idx) returns the image for each visible index
+        b = self.bounds
+        idx = np.flatnonzero((xs < b.right) & (ys < b.bottom) & (xs + ws > b.left) & (ys + hs > b.top))
+        self.submitted += len(xs)
+        self.culled += len(xs) - len(idx)
+        if len(idx):
+            self.layers[layer].extend(zip(images(idx), zip(xs[idx].tolist(), ys[idx].tolist())))
+
+    def flush(self, surface):
+        draw_calls = 0
+        for name in RENDER_LAYERS:
+            blits = self.layers[name]
+            if blits:
+                surface.blits(blits, doreturn=False)
+                blits.clear()
+                draw_calls += 1
+        self.last = {"draw_calls": draw_calls, "blits": self.submitted - self.culled, "culled": self.culled}
+        self.submitted = 0
+        self.culled = 0
+
+    def stats(self):
+        return dict(self.last)
+
+queue = RenderQueue()
@@ -0,0 +1,136 @@
+import pygame
+from .constants import BLACK, TEXTURE_IDLE_FRAMES
+
+# Two ways to get a frame on screen:
+#   surface  every blit is done in software onto the set_mode display surface
+#   texture  pygame._sdl2.video; cached images are uploaded once as textures
+#            and the SDL renderer composites them (GPU, or SDL's software
+#            renderer where there is none)
+# The render queue, the menu, pause and game over screens draw on `target`,
+# which only needs fill, blit and blits. Screens that use pygame.draw
+# (settings, stats, controls) draw onto `screen`, which the texture backend
+# uploads as one texture. Full screen backgrounds go through backdrop().
+BACKENDS = ("surface", "texture")
+
+class SurfaceRenderer:
+    name = "surface"
+
+    def __init__(self, size, title, scale=1, software=False, vsync=False):
+        self.vsync = False
+        if vsync:
+            # pygame only honours vsync on renderer-backed (SCALED) displays
+            try:
+                self.screen = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+                self.vsync = True
+            except pygame.error as e:
+                print(f"VSync unavailable ({e})")
+        if not self.vsync:
+            self.screen = pygame.display.set_mode(size)
+        self.target = self.screen
+        pygame.display.set_caption(title)
+
+    def set_icon(self, icon):
+        pygame.display.set_icon(icon)
+
+    def clear(self):
+        self.screen.fill(BLACK)
+
+    def show_screen(self):
+        pass
+
+    def backdrop(self, draw, key):
+        draw(self.screen)
+
+    def flip(self):
+        pygame.display.flip()
+
+    def stats(self):
+        return {"backend": self.name, "vsync": self.vsync}
+
+class TextureRenderer:
+    name = "texture"
+
+    def __init__(self, size, title, scale=1, software=False, vsync=False):
+        from pygame._sdl2.video import Window, Renderer, Texture
+        self.Texture = Texture
+        self.software = software
+        self.window = Window(title, (size[0] * scale, size[1] * scale))
+        # accelerated=0 asks for SDL's software renderer, -1 takes the best available
+        self.renderer = Renderer(self.window, accelerated=0 if software else -1, vsync=vsync)
+        self.vsync = vsync
+        self.renderer.logical_size = size # Scales everything, mouse coordinates included
+        self.screen = pygame.Surface(size)
+        self.screen_texture = Texture(self.renderer, size, streaming=True)
+        self.screen_key = None # What the screen texture last held, if it was a backdrop
+        self.target = self
+        self.textures = {} # id(surface) -> [surface, texture, last frame used]
+        self.frame = 0
+        self.uploads = 0
+        self.evicted = 0
+
+    def set_icon(self, icon):
+        self.window.set_icon(icon)
+
+    def texture(self, image):
+        # The surface is kept in the entry so its id can't be reused while cached.
+        # Cached images are never drawn on after they are built, so one upload each.
+        entry = self.textures.get(id(image))
+        if entry is None or entry[0] is not image:
+            entry = [image, self.Texture.from_surface(self.renderer, image), self.frame]
+            self.textures[id(image)] = entry
+            self.uploads += 1
+        entry[2] = self.frame
+        return entry[1]
+
+    def blit(self, image, pos):
+        self.texture(image).draw(dstrect=tuple(pos))
+
+    def blits(self, blits, doreturn=False):
+        texture = self.texture
+        for image, pos in blits:
+            texture(image).draw(dstrect=pos)
+
+    def fill(self, color):
+        self.renderer.draw_color = (*color[:3], 255)
+        self.renderer.clear()
+
+    def clear(self):
+        # Screens drawn on `screen` fill it themselves
+        self.fill(BLACK)
+
+    def show_screen(self):
+        self.screen_texture.update(self.screen)
+        self.screen_key = None
+        self.screen_texture.draw()
+
+    def backdrop(self, draw, key):
+        # Full screen backgrounds are too big to blend cheaply as textures, so
+        # they are drawn on `screen` and uploaded, only when `key` changes
+        if key != self.screen_key:
+            draw(self.screen)
+            self.screen_texture.update(self.screen)
+            self.screen_key = key
+        self.screen_texture.draw()
+
+    def flip(self):
+        self.renderer.present()
+        self.frame += 1
+        if self.frame % TEXTURE_IDLE_FRAMES == 0:
+            # Drop textures for surfaces nobody has drawn in a while (old text, profiler panels)
+            stale = [key for key, entry in self.textures.items() if self.frame - entry[2] > TEXTURE_IDLE_FRAMES]
+            for key in stale:
+                del self.textures[key]
+            self.evicted += len(stale)
+
+    def stats(self):
+        return {"backend": self.name, "vsync": self.vsync, "software": self.software, "textures": len(self.textures),
+                "uploads": self.uploads, "evicted": self.evicted}
+
+def create(name, size, title, scale=1, software=False, vsync=False):
+    # Falls back to the Surface backend if the texture one can't start
+    if name == "texture":
+        try:
+            return TextureRenderer(size, title, scale, software, vsync)
+        except (ImportError, pygame.error) as e:
+            print(f"Texture renderer unavailable ({e}), using surfaces")
+    return SurfaceRenderer(size, title, scale, software, vsync)
@@ -0,0 +1,210 @@
+import os
+import sys
+import time
+import zlib
+import struct
+from array import array
+from .constants import Difficulty, GameState
+from . import globals
+from . import inputs
+from . import particles
+from . import projectiles
+from . import timeline
+
+# A recording is one run: the seed, the difficulty, the wave timeline, and
+# one input byte plus a 16-bit state checksum per simulation tick. Everything
+# else the sim needs is derived from the seed, so a replay fed the same bytes
+# must reproduce the same checksums tick for tick.
+# VERSION goes up whenever the checksum fields change, since older files
+# could never verify. Version 2 dropped the spawn timer for the wave timeline
+# and added the timeline to the header.
+MAGIC = b"SSRP"
+VERSION = 2
+PREFIX = struct.Struct("<4sB") # magic, version
+HEADER = struct.Struct("<4sBQIBHI") # + seed, ticks, difficulty name length, timeline path length, timeline crc32
+
+def encode_input(move, fire):
+    return (move + 1) | (4 if fire else 0)
+
+def decode_input(value):
+    return (value & 3) - 1, bool(value & 4)
+
+def state_checksum():
+    values = [globals.score, globals.wave,
+              len(globals.particles), particles.system.count]
+    if globals.player:
+        values += [globals.player.rect.x, globals.player.health]
+    for enemy in globals.enemies:
+        values += [enemy.rect.x, enemy.rect.y, enemy.hp, enemy.next_due]
+    for group in (globals.bullets, globals.powerups):
+        for sprite in group:
+            values += [sprite.rect.x, sprite.rect.y]
+    crc = zlib.crc32(array("q", values).tobytes())
+    return zlib.crc32(projectiles.enemy_bullets.checksum_bytes(), crc) & 0xFFFF
+
+class Recording:
+    def __init__(self, seed, difficulty, inputs=None, checksums=None, timeline_path=None, timeline_crc=None):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.timeline_path = timeline_path
+        self.timeline_crc = timeline_crc # None if the timeline file couldn't be read
+        self.inputs = inputs if inputs is not None else bytearray()
+        self.checksums = checksums if checksums is not None else array("H")
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def save(self, path):
+        name = self.difficulty.name.encode("ascii")
+        timeline_name = (self.timeline_path or "").encode("utf-8")
+        checksums = array("H", self.checksums)
+        if sys.byteorder == "big":
+            checksums.byteswap()
+        body = zlib.compress(bytes(self.inputs) + checksums.tobytes(), 9)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, len(self.inputs), len(name), len(timeline_name), self.timeline_crc or 0))
+            f.write(name)
+            f.write(timeline_name)
+            f.write(body)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            blob = f.read()
+        magic, version = PREFIX.unpack_from(blob)
+        if magic != MAGIC:
+            raise ValueError("not a replay file")
+        if version != VERSION:
+            raise ValueError(f"recorded as version {version}, this build only plays version {VERSION} replays")
+        _, _, seed, ticks, name_len, path_len, timeline_crc = HEADER.unpack_from(blob)
+        offset = HEADER.size
+        difficulty = Difficulty[blob[offset:offset + name_len].decode("ascii")]
+        offset += name_len
+        timeline_path = blob[offset:offset + path_len].decode("utf-8")
+        offset += path_len
+        body = zlib.decompress(blob[offset:])
+        if len(body) != ticks * 3:
+            raise ValueError("file is truncated")
+        checksums = array("H", body[ticks:])
+        if sys.byteorder == "big":
+            checksums.byteswap()
+        return cls(seed, difficulty, bytearray(body[:ticks]), checksums, timeline_path, timeline_crc)
+
+class Recorder:
+    # Writes every run started while recording is on to its own file
+    def __init__(self, directory):
+        self.directory = directory
+        self.current = None
+        self.saved = []
+
+    def begin(self, seed):
+        self.finish()
+        path = timeline.waves.path
+        self.current = Recording(seed, globals.current_difficulty, timeline_path=path,
+                                 timeline_crc=timeline.file_checksum(path))
+
+    def end_tick(self):
+        if self.current is None:
+            return
+        self.current.inputs.append(encode_input(inputs.tick_move, inputs.tick_fire))
+        self.current.checksums.append(state_checksum())
+        if globals.game_state == GameState.GAME_OVER:
+            self.finish()
+
+    def finish(self):
+        recording, self.current = self.current, None
+        if recording is None or not len(recording):
+            return
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.directory, f"run_{stamp}_{recording.difficulty.name.lower()}_{recording.seed}.rpl")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            recording.save(path)
+            self.saved.append(path)
+            print(f"Recorded {len(recording)} ticks to {path}")
+        except OSError as e:
+            print(f"Could not save replay: {e}")
+
+class Playback:
+    # Feeds a recording back one tick at a time and checks every checksum
+    def __init__(self, recording):
+        self.recording = recording
+        self.tick = 0
+        self.diverged_at = None
+
+    @property
+    def done(self):
+        return self.diverged_at is not None or self.tick >= len(self.recording)
+
+    def feed(self):
+        move, fire = decode_input(self.recording.inputs[self.tick])
+        inputs.scripted_move = move
+        inputs.fire_requested = fire
+
+    def end_tick(self):
+        expected = self.recording.checksums[self.tick]
+        actual = state_checksum()
+        if actual != expected:
+            self.diverged_at = self.tick
+            print(f"Replay diverged at tick {self.tick}: checksum {actual:04x}, recorded {expected:04x}")
+        self.tick += 1
+
+recorder = None
+playback = None
+
+def start_recording(directory):
+    global recorder
+    recorder = Recorder(directory)
+
+def stop_recording():
+    if recorder is not None:
+        recorder.finish()
+
+def use_timeline(recording):
+    # Points the wave timeline at the file the run was recorded with. The
+    # current one is kept if its contents match; otherwise the recorded path
+    # is tried, and a replay that can't get the same spawns is refused.
+    if recording.timeline_crc is None:
+        return
+    if timeline.file_checksum(timeline.waves.path) == recording.timeline_crc:
+        return
+    if recording.timeline_path and timeline.file_checksum(recording.timeline_path) == recording.timeline_crc:
+        timeline.waves.path = recording.timeline_path
+        print(f"Replay uses wave timeline {recording.timeline_path}")
+        return
+    raise ValueError(f"replay was recorded with wave timeline {recording.timeline_path} "
+                     f"(crc {recording.timeline_crc:08x}), which is missing or has changed; pass it with --timeline")
+
+def start_playback(recording):
+    # Raises ValueError if the recording's wave timeline isn't available
+    global playback
+    from .core import start_game
+    use_timeline(recording)
+    globals.current_difficulty = recording.difficulty
+    playback = Playback(recording)
+    start_game(recording.seed)
+
+def finish_playback():
+    # Hands control back to the keyboard; returns True if every tick matched
+    global playback
+    finished, playback = playback, None
+    inputs.reset()
+    if finished.diverged_at is None:
+        print(f"Replay verified: {finished.tick} ticks matched")
+    return finished.diverged_at is None
+
+# --- Hooks called by core ---
+def begin_run(seed):
+    if recorder is not None and playback is None:
+        recorder.begin(seed)
+
+def begin_tick():
+    if playback is not None and not playback.done:
+        playback.feed()
+
+def end_tick():
+    if playback is not None:
+        if not playback.done:
+            playback.end_tick()
+    elif recorder is not None:
+        recorder.end_tick()
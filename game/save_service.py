@@ -0,0 +1,178 @@
+import os
+import json
+import zlib
+import queue
+import pickle
+import struct
+import threading
+from .constants import JOURNAL_COMPACT_EVERY
+
+# Saves are a pickled snapshot plus an append-only journal of finished runs.
+# Each journal record is <length, crc32> followed by a JSON payload; replay
+# stops at the first short or mismatching record, so a crash mid-append only
+# loses that record. The snapshot itself is only ever replaced atomically.
+RECORD_HEADER = struct.Struct("<II")
+SEQ_KEY = "journal_seq" # Last journal record folded into the snapshot
+
+def apply_run(game_data, record):
+    entry = game_data.get(record["difficulty"])
+    if entry is None:
+        return
+    entry["high_score"] = max(entry["high_score"], record["score"])
+    entry["games_played"] += 1
+
+def encode_record(record):
+    payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+    return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+def read_journal(path):
+    # Returns (records, valid_length) for the intact prefix of the journal
+    records = []
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+    except OSError:
+        return records, 0
+
+    offset = 0
+    while offset + RECORD_HEADER.size <= len(blob):
+        length, crc = RECORD_HEADER.unpack_from(blob, offset)
+        start = offset + RECORD_HEADER.size
+        payload = blob[start:start + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            break
+        try:
+            records.append(json.loads(payload.decode("utf-8")))
+        except ValueError:
+            break
+        offset = start + length
+    return records, offset
+
+def _fsync_dir(path):
+    if os.name == 'nt':
+        return
+    fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def write_atomic(path, payload):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_dir(path)
+
+def load(snapshot_path, journal_path, game_data):
+    # Merge snapshot then journal into game_data (already holding defaults).
+    # Returns (records still in the journal, last sequence number seen).
+    snapshot_seq = 0
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path, "rb") as f:
+            saved_data = pickle.load(f)
+        # We'll valid keys to avoid corruption issues
+        for key in game_data:
+            if key in saved_data:
+                game_data[key] = saved_data[key]
+        snapshot_seq = saved_data.get(SEQ_KEY, 0)
+
+    records, valid_length = read_journal(journal_path)
+    last_seq = snapshot_seq
+    for record in records:
+        # Records already in the snapshot survive a crash mid-compaction
+        if record["seq"] > snapshot_seq:
+            apply_run(game_data, record)
+        last_seq = max(last_seq, record["seq"])
+
+    # Drop a torn or corrupt tail so new appends start on a clean boundary
+    if os.path.exists(journal_path) and os.path.getsize(journal_path) > valid_length:
+        print(f"Discarding corrupt save journal tail ({os.path.getsize(journal_path) - valid_length} bytes)")
+        with open(journal_path, "r+b") as f:
+            f.truncate(valid_length)
+    return records, last_seq
+
+class SaveService:
+    # Background writer. The main thread only enqueues; the worker owns its
+    # own copy of the data so compaction never races with gameplay.
+    def __init__(self, snapshot_path, journal_path, history=None):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.history = history # Optional RunHistory fed from the same thread
+        self.queue = queue.Queue()
+        self.thread = None
+        self.data = None
+        self.seq = 0
+        self.pending_records = 0
+        self.writes = 0
+        self.compactions = 0
+        self.errors = 0
+
+    def start(self, game_data, journal_records=(), last_seq=0):
+        if self.thread is not None:
+            return
+        self.data = pickle.loads(pickle.dumps(game_data))
+        self.pending_records = len(journal_records)
+        self.seq = last_seq
+        self.thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self.thread.start()
+        if journal_records and self.history is not None:
+            # Runs journaled before a crash may never have reached the history
+            self.queue.put(("history", list(journal_records)))
+
+    def record_run(self, record):
+        if self.thread is None:
+            return
+        self.queue.put(("run", record))
+
+    def shutdown(self):
+        # Flush everything queued, compact, and stop the worker
+        if self.thread is None:
+            return
+        self.queue.put(("stop", None))
+        self.thread.join()
+        self.thread = None
+
+    def _run(self):
+        while True:
+            kind, payload = self.queue.get()
+            try:
+                if kind == "run":
+                    self._append(payload)
+                elif kind == "history":
+                    self.history.record(payload)
+                elif kind == "stop":
+                    if self.pending_records:
+                        self._compact()
+                    return
+            except Exception as e:
+                self.errors += 1
+                print(f"Error saving game data: {e}")
+
+    def _append(self, record):
+        self.seq += 1
+        record = dict(record, seq=self.seq)
+        with open(self.journal_path, "ab") as f:
+            f.write(encode_record(record))
+            f.flush()
+            os.fsync(f.fileno())
+        apply_run(self.data, record)
+        self.writes += 1
+        if self.history is not None:
+            self.history.record([record])
+        self.pending_records += 1
+        if self.pending_records >= JOURNAL_COMPACT_EVERY:
+            self._compact()
+
+    def _compact(self):
+        # New snapshot first, then an empty journal. A crash in between leaves
+        # old records in the journal, which load() skips by sequence number.
+        write_atomic(self.snapshot_path, pickle.dumps(dict(self.data, **{SEQ_KEY: self.seq})))
+        write_atomic(self.journal_path, b"")
+        self.pending_records = 0
+        self.compactions += 1
+
+    def stats(self):
+        return {"writes": self.writes, "compactions": self.compactions, "queued": self.queue.qsize(), "errors": self.errors}
@@ -0,0 +1,41 @@
+import heapq
+import itertools
+
+class Scheduler:
+    # Min-heap of (due tick, order, token, sprite). Each tick pops only what
+    # is due, so the cost follows the number of events rather than the number
+    # of sprites. Nothing is ever removed early: dead sprites and entries
+    # superseded by a later schedule() are skipped when they surface.
+    def __init__(self):
+        self.heap = []
+        self.order = itertools.count()
+        self.scheduled = 0
+        self.fired = 0
+        self.cancelled = 0
+
+    def schedule(self, sprite, due):
+        sprite.schedule_token = getattr(sprite, "schedule_token", 0) + 1
+        sprite.next_due = due
+        heapq.heappush(self.heap, (due, next(self.order), sprite.schedule_token, sprite))
+        self.scheduled += 1
+
+    def pop_due(self, tick):
+        due = []
+        heap = self.heap
+        while heap and heap[0][0] <= tick:
+            _, _, token, sprite = heapq.heappop(heap)
+            if token != sprite.schedule_token or not sprite.alive():
+                self.cancelled += 1
+                continue
+            due.append(sprite)
+        self.fired += len(due)
+        return due
+
+    def clear(self):
+        self.heap.clear()
+
+    def stats(self):
+        return {"pending": len(self.heap), "scheduled": self.scheduled, "fired": self.fired, "cancelled": self.cancelled}
+
+# Enemy fire, keyed by globals.tick
+enemy_fire = Scheduler()
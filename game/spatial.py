@@ -0,0 +1,83 @@
+import pygame
+from .constants import COLLISION_CELL_SIZE, COLLISION_HASH_MIN_PAIRS
+
+class SpatialHash:
+    # Uniform grid of buckets. Entries remember their insertion order so
+    # queries come back in the same order the group iterates.
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, order, item, rect):
+        cs = self.cell_size
+        cells = self.cells
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [(order, item)]
+                else:
+                    bucket.append((order, item))
+
+    def build(self, sprites):
+        self.clear()
+        for order, sprite in enumerate(sprites):
+            self.insert(order, sprite, sprite.rect)
+
+    def query(self, rect):
+        cs = self.cell_size
+        cells = self.cells
+        buckets = []
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    buckets.append(bucket)
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            # Buckets are filled in insertion order already
+            return [item for _, item in buckets[0]]
+        found = {}
+        for bucket in buckets:
+            for order, item in bucket:
+                found[order] = item
+        return [found[k] for k in sorted(found)]
+
+_grid = SpatialHash()
+
+# Drop-in replacements for pygame.sprite.spritecollide / groupcollide.
+# Same rect test, same result ordering, same kill semantics.
+# Normal play peaks around a dozen enemies against a dozen bullets, where
+# pygame's scan wins, so the grid is a fallback for dense late waves.
+def spritecollide(sprite, group, dokill):
+    # One rect against a group is a single scan; building a grid for it costs
+    # far more than it saves
+    return pygame.sprite.spritecollide(sprite, group, dokill)
+
+def groupcollide(groupa, groupb, dokilla, dokillb):
+    # The grid only pays for itself once there are enough pairs to test
+    if len(groupa) * len(groupb) < COLLISION_HASH_MIN_PAIRS:
+        return pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb)
+    return hashed_groupcollide(groupa, groupb, dokilla, dokillb)
+
+def hashed_groupcollide(groupa, groupb, dokilla, dokillb):
+    _grid.build(groupb.sprites())
+    killed = set()
+    crashed = {}
+    for a in groupa.sprites():
+        rect = a.rect
+        hits = [b for b in _grid.query(rect) if b not in killed and rect.colliderect(b.rect)]
+        if not hits:
+            continue
+        crashed[a] = hits
+        if dokillb:
+            for b in hits:
+                b.kill()
+                killed.add(b)
+        if dokilla:
+            a.kill()
+    return crashed
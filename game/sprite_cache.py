@@ -0,0 +1,47 @@
+import pygame
+
+# Pre-rendered images shared by every sprite of the same look.
+# Builders are registered per kind and called once per distinct key.
+_builders = {}
+_images = {}
+
+hits = 0
+misses = 0
+total_bytes = 0
+
+def register(kind):
+    def decorator(builder):
+        _builders[kind] = builder
+        return builder
+    return decorator
+
+def get_image(kind, *key):
+    global hits, misses, total_bytes
+    cache_key = (kind, *key)
+    img = _images.get(cache_key)
+    if img is not None:
+        hits += 1
+        return img
+
+    misses += 1
+    img = _builders[kind](*key)
+    # Match the display format so blits don't convert every frame.
+    # Colorkeyed images stay colorkeyed; they blit much faster than per-pixel alpha.
+    if pygame.display.get_surface() is not None:
+        colorkey = img.get_colorkey()
+        if colorkey is not None:
+            img = img.convert()
+            img.set_colorkey(colorkey, pygame.RLEACCEL)
+        else:
+            img = img.convert_alpha()
+    total_bytes += img.get_width() * img.get_height() * img.get_bytesize()
+    _images[cache_key] = img
+    return img
+
+def clear():
+    global total_bytes
+    _images.clear()
+    total_bytes = 0
+
+def stats():
+    return {"images": len(_images), "hits": hits, "misses": misses, "bytes": total_bytes}
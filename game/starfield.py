@@ -0,0 +1,68 @@
+import pygame
+import random
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, STAR_COUNT, STAR_LAYERS
+
+class StarLayer:
+    # A screen-sized sheet of stars at one depth, scrolled as a whole
+    def __init__(self, z, count):
+        self.z = z # Depth/Speed factor
+        self.offset = 0.0
+        self.image = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.image.fill((0, 0, 0))
+        self.image.set_colorkey((0, 0, 0), pygame.RLEACCEL) # Sparse sheet, RLE skips the gaps
+
+        for _ in range(count):
+            x = random.randint(0, SCREEN_WIDTH)
+            y = random.randint(0, SCREEN_HEIGHT - 1)
+            brightness = random.randint(100, 255)
+            color = (brightness, brightness, brightness)
+            pygame.draw.circle(self.image, color, (x, y), 1)
+            # Repeat stars cut by the seam on the other edge so the wrap is invisible
+            if y < 1:
+                pygame.draw.circle(self.image, color, (x, y + SCREEN_HEIGHT), 1)
+            elif y > SCREEN_HEIGHT - 2:
+                pygame.draw.circle(self.image, color, (x, y - SCREEN_HEIGHT), 1)
+
+        if pygame.display.get_surface() is not None:
+            self.image = self.image.convert()
+
+    def update(self, speed_mult):
+        self.offset = (self.offset + (1 + self.z) * speed_mult) % SCREEN_HEIGHT
+
+    def draw(self, surface):
+        y = int(self.offset)
+        surface.blit(self.image, (0, y))
+        if y > 0:
+            surface.blit(self.image, (0, y - SCREEN_HEIGHT))
+
+    def submit(self, queue):
+        y = int(self.offset)
+        queue.submit("background", self.image, (0, y))
+        if y > 0:
+            queue.submit("background", self.image, (0, y - SCREEN_HEIGHT))
+
+class Starfield:
+    # Stars are baked into a few depth layers once, so drawing costs two
+    # blits per layer no matter how many stars there are.
+    def __init__(self, count=STAR_COUNT, layers=STAR_LAYERS):
+        self.count = count
+        self.layers = []
+        for i in range(layers):
+            z = 0.5 + 2.5 * (i + 0.5) / layers
+            self.layers.append(StarLayer(z, count // layers))
+
+    def update(self, speed_mult=1.0):
+        for layer in self.layers:
+            layer.update(speed_mult)
+
+    def draw(self, surface):
+        for layer in self.layers:
+            layer.draw(surface)
+
+    def positions(self):
+        # Changes whenever a drawn frame would
+        return tuple(int(layer.offset) for layer in self.layers)
+
+    def submit(self, queue):
+        for layer in self.layers:
+            layer.submit(queue)
@@ -0,0 +1,115 @@
+import os
+import json
+import time
+import threading
+import pygame
+from .constants import STARTUP_BUDGET_MS
+from . import data
+
+FONT_CANDIDATES = ('consolas', 'couriernew', 'monospace')
+FONT_CACHE_FILE_NAME = "font_cache.json"
+
+class Timeline:
+    # Wall-clock marks since process start, printed as a breakdown
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.marks = []
+        self.reported = 0 # Marks already printed by an earlier report
+
+    def mark(self, label):
+        now = time.perf_counter()
+        self.marks.append((label, (now - self.last) * 1000.0, (now - self.start) * 1000.0))
+        self.last = now
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000.0
+
+    def report(self, title):
+        # Prints the marks added since the last report
+        print(title)
+        for label, step_ms, total_ms in self.marks[self.reported:]:
+            print(f"  {label:<32} {step_ms:8.1f} ms  (at {total_ms:8.1f} ms)")
+        self.reported = len(self.marks)
+
+timeline = Timeline()
+
+# --- Font path cache ---
+def _font_cache_path():
+    return os.path.join(data.save_dir, FONT_CACHE_FILE_NAME)
+
+def cached_font_path():
+    # Returns (found, path). path may be None when no candidate font exists.
+    try:
+        with open(_font_cache_path(), "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return False, None
+    if cached.get("candidates") != list(FONT_CANDIDATES):
+        return False, None
+    path = cached.get("path")
+    if path is not None and not os.path.exists(path):
+        return False, None
+    return True, path
+
+def resolve_font_path():
+    # Scanning system fonts is slow; the result is cached for the next launch
+    try:
+        path = pygame.font.match_font(*FONT_CANDIDATES)
+    except:
+        path = None
+    try:
+        with open(_font_cache_path(), "w") as f:
+            json.dump({"candidates": list(FONT_CANDIDATES), "path": path}, f)
+    except OSError as e:
+        print(f"Could not write font cache: {e}")
+    return path
+
+# --- Background loading ---
+class BackgroundLoader:
+    # Runs the slow parts of startup on a worker thread. The main loop calls
+    # poll() every frame and applies finished results on the main thread.
+    def __init__(self):
+        self.jobs = []
+        self.results = {}
+        self.applied = set()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def add(self, name, job, apply=None):
+        self.jobs.append((name, job, apply))
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="startup-loader", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        for name, job, _ in self.jobs:
+            start = time.perf_counter()
+            try:
+                result = job()
+            except Exception as e:
+                print(f"Background job {name} failed: {e}")
+                result = None
+            with self.lock:
+                self.results[name] = (result, (time.perf_counter() - start) * 1000.0)
+
+    def poll(self):
+        # Returns True once every job has finished and been applied
+        if len(self.applied) == len(self.jobs):
+            return True
+        with self.lock:
+            finished = [(name, self.results[name]) for name, _, _ in self.jobs
+                        if name in self.results and name not in self.applied]
+        for name, (result, job_ms) in finished:
+            apply = next(a for n, _, a in self.jobs if n == name)
+            if apply is not None:
+                apply(result)
+            self.applied.add(name)
+            timeline.mark(f"{name} ({job_ms:.0f} ms on worker)")
+        return len(self.applied) == len(self.jobs)
+
+def report_first_frame():
+    elapsed = timeline.elapsed_ms()
+    status = "within" if elapsed <= STARTUP_BUDGET_MS else "OVER"
+    timeline.report(f"Menu interactive after {elapsed:.0f} ms ({status} {STARTUP_BUDGET_MS} ms budget)")
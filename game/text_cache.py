@@ -0,0 +1,60 @@
+import pygame
+from collections import OrderedDict
+from .constants import TEXT_CACHE_SIZE
+
+# Rendered text surfaces keyed by (font, text, color, antialias), least
+# recently used first. Fonts are keyed by identity, so swapping fonts at
+# runtime just lets the old entries age out.
+_surfaces = OrderedDict()
+
+hits = 0
+misses = 0
+evictions = 0
+
+def _lookup(key, build):
+    global hits, misses, evictions
+    surf = _surfaces.get(key)
+    if surf is not None:
+        _surfaces.move_to_end(key)
+        hits += 1
+        return surf
+
+    misses += 1
+    surf = build()
+    _surfaces[key] = surf
+    if len(_surfaces) > TEXT_CACHE_SIZE:
+        _surfaces.popitem(last=False)
+        evictions += 1
+    return surf
+
+def render(font, text, color, antialias=True):
+    return _lookup((font, text, color, antialias), lambda: font.render(text, antialias, color))
+
+def render_glow(font, text, color, glow_color, spread=3, glow_alpha=50):
+    # Text with horizontal glow passes on both sides, composited once
+    def build():
+        glow = font.render(text, True, glow_color)
+        glow.set_alpha(glow_alpha)
+        w, h = glow.get_size()
+        # Transparent fill in the glow color so the passes blend like they do on screen
+        surf = pygame.Surface((w + spread * 2, h), pygame.SRCALPHA)
+        surf.fill((*glow_color, 0))
+        for offset in range(spread, 0, -1):
+            surf.blit(glow, (spread - offset, 0))
+            surf.blit(glow, (spread + offset, 0))
+        surf.blit(font.render(text, True, color), (spread, 0))
+        return surf
+    return _lookup((font, text, color, "glow", glow_color, spread, glow_alpha), build)
+
+def clear():
+    _surfaces.clear()
+
+def stats():
+    total = hits + misses
+    return {
+        "entries": len(_surfaces),
+        "hits": hits,
+        "misses": misses,
+        "evictions": evictions,
+        "hit_rate": hits / total if total else 0.0,
+    }
@@ -0,0 +1,204 @@
+import os
+import zlib
+import heapq
+import itertools
+from collections import namedtuple
+from .constants import SIM_FPS, SIM_DT, TIMELINE_CHUNK_LINES
+
+# Wave timelines are plain text, one directive per line, in time order:
+#
+#   TIME  spawn   KIND X FORMATION COUNT [MULT]   one group of enemies
+#   TIME  stream  KIND UNTIL [MULT]               the classic ramping spawner
+#   TIME  waves   EVERY [UNTIL]                   bump the wave counter
+#
+# TIME, UNTIL and EVERY are simulated seconds from the start of the run
+# (UNTIL may be "-" for never). KIND is auto, normal or elite; X is a pixel
+# column or "random"; FORMATION is single, line, column or vee. Enemy
+# difficulty is ramp(time) * the difficulty setting * MULT.
+#
+# The stream ramp and the wave counter read the sim clock the way core keeps
+# game_time, SIM_DT summed once per tick. The sum runs slightly behind
+# tick / SIM_FPS, so "60 waves 30" bumps the wave on tick 3601, the same
+# tick the old game_time check did.
+#
+# Files are read TIMELINE_CHUNK_LINES at a time, only once the queue needs
+# events that far ahead, so long scripted levels never parse up front.
+DEFAULT_TIMELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "waves", "default.wave")
+
+SpawnEvent = namedtuple("SpawnEvent", "kind x formation count mult")
+WaveEvent = namedtuple("WaveEvent", "")
+# Directives start their own sources when they come due
+StreamDirective = namedtuple("StreamDirective", "kind until mult")
+WavesDirective = namedtuple("WavesDirective", "start every until") # start and every in seconds
+
+KINDS = ("auto", "normal", "elite")
+FORMATIONS = ("single", "line", "column", "vee")
+
+def ramp(game_time):
+    # Base difficulty over a run, before the difficulty setting
+    if game_time < 120:
+        return 1.0 + (game_time / 60.0)
+    return 3.0 + ((game_time - 120) / 30.0)
+
+def spawn_rate(difficulty):
+    # Ticks between spawns for the stream directive
+    return max(15, int(60 / (difficulty * 0.8)))
+
+def to_tick(seconds):
+    return int(round(float(seconds) * SIM_FPS))
+
+def to_until(value):
+    return None if value == "-" else to_tick(value)
+
+def formation_offsets(formation, count):
+    # (dx, dy) per enemy around the anchor; later enemies sit further up
+    spacing = 60
+    if formation == "line":
+        return [((i - (count - 1) / 2) * spacing, 0) for i in range(count)]
+    if formation == "column":
+        return [(0, -i * spacing) for i in range(count)]
+    if formation == "vee":
+        return [((i - (count - 1) / 2) * spacing, -abs(i - (count - 1) / 2) * spacing // 2) for i in range(count)]
+    return [(0, 0)] * count
+
+def sim_clock(start=0):
+    # (tick, game_time) for every tick after start, summed like core sums it
+    game_time = 0.0
+    for _ in range(start):
+        game_time += SIM_DT
+    tick = start
+    while True:
+        tick += 1
+        game_time += SIM_DT
+        yield tick, game_time
+
+# --- Sources: time-ordered iterators of (tick, item) ---
+def stream_source(start, until, kind, mult, diff_mult):
+    # The original frame-counter spawner, one enemy whenever the counter
+    # passes the rate for the current difficulty
+    timer = 0
+    event = SpawnEvent(kind, None, "single", 1, mult)
+    for tick, game_time in sim_clock(start):
+        if until is not None and tick > until:
+            return
+        timer += 1
+        if timer > spawn_rate(ramp(game_time) * mult * diff_mult):
+            timer = 0
+            yield tick, event
+
+def waves_source(at, start, every, until):
+    # A wave on the first tick game_time reaches start + n * every. That can
+    # be a tick after the directive itself, which was rounded to a tick.
+    event = WaveEvent()
+    n = 0
+    for tick, game_time in sim_clock(max(0, at - 1)):
+        if until is not None and tick >= until:
+            return
+        if game_time >= start + n * every:
+            n += 1
+            yield tick, event
+
+def file_checksum(path):
+    # crc32 of a timeline file, so a replay can tell which one drove its spawns
+    crc = 0
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                crc = zlib.crc32(chunk, crc)
+    except OSError:
+        return None
+    return crc
+
+def parse_line(words):
+    verb = words[1]
+    if verb == "spawn":
+        kind, x, formation, count = words[2:6]
+        mult = float(words[6]) if len(words) > 6 else 1.0
+        if kind not in KINDS or formation not in FORMATIONS:
+            raise ValueError("unknown kind or formation")
+        return SpawnEvent(kind, None if x == "random" else int(x), formation, int(count), mult)
+    if verb == "stream":
+        kind, until = words[2:4]
+        if kind not in KINDS:
+            raise ValueError(f"unknown kind {kind}")
+        mult = float(words[4]) if len(words) > 4 else 1.0
+        return StreamDirective(kind, to_until(until), mult)
+    if verb == "waves":
+        every = float(words[2])
+        if every * SIM_FPS < 1:
+            raise ValueError("waves needs an interval of at least one tick")
+        return WavesDirective(float(words[0]), every, to_until(words[3]) if len(words) > 3 else None)
+    raise ValueError(f"unknown directive {verb}")
+
+class Timeline:
+    def __init__(self, path=None):
+        self.path = path or DEFAULT_TIMELINE
+        self.diff_mult = 1.0 # Difficulty setting for the current run
+        self.queue = []
+        self.order = itertools.count()
+        self.chunks = 0
+        self.popped = 0
+
+    def start(self, diff_mult):
+        self.diff_mult = diff_mult
+        self.queue = []
+        self.push(self.file_source())
+
+    def push(self, source):
+        # Queue the next item of a source; the source is re-pushed as it drains
+        for tick, item in source:
+            heapq.heappush(self.queue, (tick, next(self.order), item, source))
+            return
+
+    def file_source(self):
+        try:
+            f = open(self.path, "r")
+        except OSError as e:
+            print(f"Could not load wave timeline: {e}")
+            return
+        with f:
+            lineno = 0
+            last = 0
+            while True:
+                lines = list(itertools.islice(f, TIMELINE_CHUNK_LINES))
+                if not lines:
+                    return
+                self.chunks += 1
+                for line in lines:
+                    lineno += 1
+                    words = line.split("#", 1)[0].split()
+                    if not words:
+                        continue
+                    try:
+                        tick = to_tick(words[0])
+                        item = parse_line(words)
+                    except (ValueError, IndexError) as e:
+                        print(f"{self.path}:{lineno}: skipped ({e or 'missing field'})")
+                        continue
+                    if tick < last:
+                        print(f"{self.path}:{lineno}: out of order, runs at {last / SIM_FPS:.2f}s")
+                        tick = last
+                    last = tick
+                    yield tick, item
+
+    def pop_due(self, tick):
+        # Events due on or before tick, in time order. Directives start their
+        # own sources when they come due; nothing beyond tick is parsed.
+        due = []
+        queue = self.queue
+        while queue and queue[0][0] <= tick:
+            at, _, item, source = heapq.heappop(queue)
+            self.push(source)
+            if isinstance(item, StreamDirective):
+                self.push(stream_source(at, item.until, item.kind, item.mult, self.diff_mult))
+            elif isinstance(item, WavesDirective):
+                self.push(waves_source(at, item.start, item.every, item.until))
+            else:
+                due.append(item)
+        self.popped += len(due)
+        return due
+
+    def stats(self):
+        return {"pending": len(self.queue), "chunks": self.chunks, "popped": self.popped}
+
+waves = Timeline()
@@ -2,8 +2,15 @@ import pygame
 from .constants import *
 from . import globals
 from .audio import play_sound, change_volume, change_sfx_volume
-from .core import start_game
-from .data import change_difficulty
+from .core import start_game, interpolated_pos
+from .data import change_difficulty, run_summary
+from . import text_cache
+from . import sprite_cache
+from . import particles
+from . import projectiles
+from . import render_queue
+from .pacing import pacer
+from .profiler import profiler
 
 # --- UI Components ---
 class Button:
@@ -22,13 +29,12 @@ class Button:
         
         color = self.hover_color if is_hovered else self.bg_color
         
-        # Draw button body
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, self.border_color, self.rect, 2, border_radius=8)
+        # Draw button body (cached, so buttons are plain blits on any backend)
+        surface.blit(sprite_cache.get_image("button", self.rect.width, self.rect.height, color, self.border_color), self.rect)
         
         # Draw text
         # Assuming fonts are initialized in globals
-        txt_surf = globals.font_md.render(self.text, True, self.text_color)
+        txt_surf = text_cache.render(globals.font_md, self.text, self.text_color)
         txt_rect = txt_surf.get_rect(center=self.rect.center)
         surface.blit(txt_surf, txt_rect)
         
@@ -50,6 +56,7 @@ def action_settings():
     globals.game_state = GameState.SETTINGS
 
 def action_stats():
+    globals.stats_summary = run_summary()
     globals.game_state = GameState.STATS
 
 def action_controls():
@@ -85,12 +92,18 @@ def init_settings_buttons():
         Button(">", 560, 385, 50, 50, lambda: change_difficulty(1), NEON_GREEN, DARK_UI),
         Button("<", 190, 385, 50, 50, lambda: change_difficulty(-1), NEON_RED, DARK_UI),
         
-        Button("BACK", SCREEN_WIDTH//2 - 100, 520, 200, 50, action_back, WHITE)
+        # Frame pacing: < > pick the mode, - + the target rate
+        Button(">", 560, 445, 50, 50, lambda: pacer.cycle_mode(1), NEON_GREEN, DARK_UI),
+        Button("<", 190, 445, 50, 50, lambda: pacer.cycle_mode(-1), NEON_RED, DARK_UI),
+        Button("+", 630, 445, 50, 50, lambda: pacer.cycle_rate(1), NEON_GREEN, DARK_UI),
+        Button("-", 120, 445, 50, 50, lambda: pacer.cycle_rate(-1), NEON_RED, DARK_UI),
+        
+        Button("BACK", SCREEN_WIDTH//2 - 100, 540, 200, 50, action_back, WHITE)
     ]
 
 def init_stats_buttons():
     globals.stats_buttons = [
-        Button("BACK", SCREEN_WIDTH//2 - 100, 500, 200, 50, action_back, WHITE)
+        Button("BACK", SCREEN_WIDTH//2 - 100, 520, 200, 50, action_back, WHITE)
     ]
 
 def init_controls_buttons():
@@ -108,84 +121,190 @@ def init_game_over_buttons():
         Button("MAIN MENU", SCREEN_WIDTH//2 - 100, 480, 200, 50, action_back, NEON_BLUE)
     ]
 
+class HudText:
+    # A HUD field that only re-renders when its value (or the font) changes
+    def __init__(self, fmt, color, font_name="font_md"):
+        self.fmt = fmt
+        self.color = color
+        self.font_name = font_name
+        self.value = None
+        self.font = None
+        self.surface = None
+
+    def get(self, value):
+        font = getattr(globals, self.font_name)
+        if self.surface is None or value != self.value or font is not self.font:
+            self.value = value
+            self.font = font
+            self.surface = text_cache.render(font, self.fmt.format(value), self.color)
+        return self.surface
+
+hud_score = HudText("SCORE: {:06d}", WHITE)
+hud_timer = HudText("{0[0]:02d}:{0[1]:02d}", NEON_YELLOW)
+hud_wave = HudText("WAVE {}", NEON_BLUE, "font_sm")
+
+class TimedText:
+    # Text that changes every frame, like live stats. It is rebuilt on a timer
+    # and rendered directly, so it doesn't churn the shared text cache.
+    def __init__(self, color, refresh_ms, font_name="font_sm"):
+        self.color = color
+        self.refresh_ms = refresh_ms
+        self.font_name = font_name
+        self.surface = None
+        self.last_refresh = 0
+
+    def get(self, make_text):
+        now = pygame.time.get_ticks()
+        if self.surface is None or now - self.last_refresh >= self.refresh_ms:
+            self.surface = getattr(globals, self.font_name).render(make_text(), True, self.color)
+            self.last_refresh = now
+        return self.surface
+
+pacing_detail = TimedText(WHITE, PACING_REFRESH_MS)
+
 # --- Drawing Functions ---
+@sprite_cache.register("panel")
+def build_ui_panel(width, height, color, border):
+    temp = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(temp, (*color, 200), (0,0,width, height), border_radius=10)
+    pygame.draw.rect(temp, border, (0,0,width, height), 2, border_radius=10)
+    return temp
+
+@sprite_cache.register("overlay")
+def build_overlay(alpha):
+    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, alpha))
+    return overlay
+
+@sprite_cache.register("button")
+def build_button(width, height, color, border):
+    image = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(image, color, (0, 0, width, height), border_radius=8)
+    pygame.draw.rect(image, border, (0, 0, width, height), 2, border_radius=8)
+    return image
+
 def draw_ui_panel(surface, rect, color=DARK_UI, border=NEON_BLUE):
-    temp = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(temp, (*color, 200), (0,0,rect.width, rect.height), border_radius=10)
-    pygame.draw.rect(temp, border, (0,0,rect.width, rect.height), 2, border_radius=10)
-    surface.blit(temp, rect)
+    surface.blit(sprite_cache.get_image("panel", rect.width, rect.height, color, border), rect)
 
-def draw_hud(screen):
+# --- Frozen Backdrops ---
+# PAUSED and GAME_OVER show a world that isn't moving, so the world, overlay
+# and static text are drawn once onto their own surface and reused. Each
+# frame is then one blit plus the buttons, which the texture renderer can
+# draw without touching its screen surface.
+def new_backdrop():
+    backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    if pygame.display.get_surface() is not None:
+        backdrop = backdrop.convert()
+    return backdrop
+
+def freeze_backdrop(backdrop, state):
+    globals.frozen_backdrop = backdrop
+    globals.frozen_state = state
+
+def thaw_backdrop():
+    globals.frozen_backdrop = None
+    globals.frozen_state = None
+
+@sprite_cache.register("health_bar")
+def build_health_bar(fill_width, fill_color):
+    bar_width, bar_height = HEALTH_BAR_SIZE
+    bar = pygame.Surface((bar_width + 4, bar_height + 4))
+    pygame.draw.rect(bar, WHITE, (0, 0, bar_width + 4, bar_height + 4), 2)
+    pygame.draw.rect(bar, (50, 0, 0), (2, 2, bar_width, bar_height))
+    if fill_width > 0:
+        pygame.draw.rect(bar, fill_color, (2, 2, fill_width, bar_height))
+    return bar
+
+def hud_blits():
+    # The HUD as (image, pos) pairs; every piece is a cached surface
+    blits = []
+    
     # Top Bar Panel
-    panel_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 60)
-    draw_ui_panel(screen, panel_rect, (10, 10, 15), (50, 50, 100))
+    blits.append((sprite_cache.get_image("panel", SCREEN_WIDTH, 60, (10, 10, 15), (50, 50, 100)), (0, 0)))
     
     # Score
-    score_txt = globals.font_md.render(f"SCORE: {globals.score:06d}", True, WHITE)
-    screen.blit(score_txt, (20, 15))
+    blits.append((hud_score.get(globals.score), (20, 15)))
     
     # Timer
     mins = int(globals.game_time // 60)
     secs = int(globals.game_time % 60)
-    time_str = f"{mins:02d}:{secs:02d}"
-    
-    # Timer Box
-    timer_surf = globals.font_md.render(time_str, True, NEON_YELLOW)
-    timer_rect = timer_surf.get_rect(center=(SCREEN_WIDTH // 2, 30))
-    screen.blit(timer_surf, timer_rect)
+    timer_surf = hud_timer.get((mins, secs))
+    blits.append((timer_surf, timer_surf.get_rect(center=(SCREEN_WIDTH // 2, 30)).topleft))
     
     # Health Bar
-    bar_width = 200
-    bar_height = 20
-    x, y = SCREEN_WIDTH - 220, 20
-    
-    pygame.draw.rect(screen, WHITE, (x-2, y-2, bar_width+4, bar_height+4), 2)
-    pygame.draw.rect(screen, (50, 0, 0), (x, y, bar_width, bar_height))
-    
+    fill_width, fill_color = 0, NEON_GREEN
     if globals.player:
         health_pct = max(0, globals.player.health / globals.player.max_health)
-        fill_width = int(bar_width * health_pct)
+        fill_width = int(HEALTH_BAR_SIZE[0] * health_pct)
         fill_color = NEON_GREEN if health_pct > 0.5 else (NEON_RED if health_pct < 0.25 else NEON_ORANGE)
-        pygame.draw.rect(screen, fill_color, (x, y, fill_width, bar_height))
+    blits.append((sprite_cache.get_image("health_bar", fill_width, fill_color), (SCREEN_WIDTH - 222, 18)))
     
     # Wave
-    wave_txt = globals.font_sm.render(f"WAVE {globals.wave}", True, NEON_BLUE)
-    screen.blit(wave_txt, (SCREEN_WIDTH//2 - 30, 65))
+    blits.append((hud_wave.get(globals.wave), (SCREEN_WIDTH//2 - 30, 65)))
+    return blits
 
-def draw_menu(screen):
+def draw_hud(screen):
+    screen.blits(hud_blits(), doreturn=False)
+
+def draw_playing(screen, offset=(0, 0), alpha=1.0):
+    # The running game, submitted layer by layer and flushed in one blits call per layer
+    queue = render_queue.queue
+    sx, sy = offset
+    with profiler.section("background"):
+        globals.starfield.submit(queue)
+    with profiler.section("sprites"):
+        for layer, group in (("trails", globals.particles), ("projectiles", globals.bullets),
+                             ("pickups", globals.powerups), ("enemies", globals.enemies)):
+            for sprite in group:
+                x, y = interpolated_pos(sprite, alpha)
+                queue.submit(layer, sprite.image, (x + sx, y + sy))
+        if globals.player:
+            x, y = interpolated_pos(globals.player, alpha)
+            queue.submit("player", globals.player.image, (x + sx, y + sy))
+        projectiles.enemy_bullets.submit(queue, offset, alpha)
+        particles.system.submit(queue, offset, alpha)
+    with profiler.section("hud"):
+        queue.submit_many("hud", hud_blits())
+    with profiler.section("flush"):
+        queue.flush(screen)
+
+def draw_starfield(screen):
     screen.fill(BLACK)
+    globals.starfield.draw(screen)
+
+def draw_menu(screen):
     # Animated background
-    for star in globals.stars:
-        star.update(0.5)
-        star.draw(screen)
+    # Stars scroll by wall time since the menu isn't driven by the sim clock
+    globals.starfield.update(0.5 * globals.frame_dt * SIM_FPS)
+    globals.renderer.backdrop(draw_starfield, globals.starfield.positions())
         
-    # Title
-    title = globals.font_xl.render("Space Shooter", True, NEON_BLUE)
-    t_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 120))
-    for offset in range(3, 0, -1):
-        glow = globals.font_xl.render("Space Shooter", True, (0, 100, 255))
-        glow.set_alpha(50)
-        screen.blit(glow, (t_rect.x - offset, t_rect.y))
-        screen.blit(glow, (t_rect.x + offset, t_rect.y))
-    screen.blit(title, t_rect)
+    # Title (glow passes are baked into one cached surface)
+    title = text_cache.render_glow(globals.font_xl, "Space Shooter", NEON_BLUE, (0, 100, 255))
+    screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, 120)))
     
     # Buttons
     for btn in globals.buttons:
         btn.draw(screen)
 
     # Footer
-    version = globals.font_sm.render(VERSION, True, (50, 50, 60))
+    version = text_cache.render(globals.font_sm, VERSION, (50, 50, 60))
     screen.blit(version, (10, SCREEN_HEIGHT - 30))
 
+def pacing_detail_text():
+    if pacer.needs_restart:
+        return "VSYNC APPLIES ON RESTART"
+    p = pacer.stats()
+    return f"{p['mean_ms']:.1f} MS  SD {p['std_ms']:.1f}  JITTER {p['jitter_ms']:.1f}  MISSED {p['missed']}/{p['frames']}"
+
 def draw_settings(screen):
     screen.fill(BLACK)
-    for star in globals.stars: star.draw(screen)
+    globals.starfield.draw(screen)
     
-    title = globals.font_lg.render("SETTINGS", True, NEON_BLUE)
+    title = text_cache.render(globals.font_lg, "SETTINGS", NEON_BLUE)
     screen.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, 100)))
     
     # Music Volume Control
-    vol_text = globals.font_md.render(f"MUSIC VOLUME: {int(globals.music_volume * 100)}%", True, WHITE)
+    vol_text = text_cache.render(globals.font_md, f"MUSIC VOLUME: {int(globals.music_volume * 100)}%", WHITE)
     screen.blit(vol_text, vol_text.get_rect(center=(SCREEN_WIDTH//2, 160)))
     
     bar_w, bar_h = 300, 20
@@ -193,7 +312,7 @@ def draw_settings(screen):
     pygame.draw.rect(screen, NEON_GREEN, (SCREEN_WIDTH//2 - 150, 200, int(bar_w * globals.music_volume), bar_h))
 
     # SFX Volume Control
-    sfx_text = globals.font_md.render(f"SFX VOLUME: {int(globals.sfx_volume * 100)}%", True, WHITE)
+    sfx_text = text_cache.render(globals.font_md, f"SFX VOLUME: {int(globals.sfx_volume * 100)}%", WHITE)
     screen.blit(sfx_text, sfx_text.get_rect(center=(SCREEN_WIDTH//2, 260)))
     
     pygame.draw.rect(screen, (50, 50, 50), (SCREEN_WIDTH//2 - 150, 300, bar_w, bar_h))
@@ -209,35 +328,38 @@ def draw_settings(screen):
         Difficulty.NIGHTMARE: NEON_RED
     }
     diff_col = diff_colors.get(globals.current_difficulty, WHITE)
-    diff_label = globals.font_md.render("DIFFICULTY", True, WHITE)
+    diff_label = text_cache.render(globals.font_md, "DIFFICULTY", WHITE)
     screen.blit(diff_label, diff_label.get_rect(center=(SCREEN_WIDTH//2, 360)))
     
-    diff_txt = globals.font_lg.render(diff_name, True, diff_col)
+    diff_txt = text_cache.render(globals.font_lg, diff_name, diff_col)
     screen.blit(diff_txt, diff_txt.get_rect(center=(SCREEN_WIDTH//2, 410)))
     
+    # Frame Pacing
+    pacing_txt = text_cache.render(globals.font_md, f"{pacer.mode.upper()} {pacer.rate} HZ", NEON_YELLOW)
+    screen.blit(pacing_txt, pacing_txt.get_rect(center=(SCREEN_WIDTH//2, 470)))
+    detail_txt = pacing_detail.get(pacing_detail_text)
+    screen.blit(detail_txt, detail_txt.get_rect(center=(SCREEN_WIDTH//2, 515)))
+    
     for btn in globals.settings_buttons:
         btn.draw(screen)
 
 def draw_stats(screen):
     screen.fill(BLACK)
-    for star in globals.stars: star.draw(screen)
+    globals.starfield.draw(screen)
     
-    title = globals.font_lg.render("STATISTICS", True, NEON_PURPLE)
+    title = text_cache.render(globals.font_lg, "STATISTICS", NEON_PURPLE)
     screen.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, 80)))
     
-    headers_y = 160
-    h1 = globals.font_md.render("DIFFICULTY", True, NEON_BLUE)
-    h2 = globals.font_md.render("HIGH SCORE", True, NEON_BLUE)
-    h3 = globals.font_md.render("GAMES", True, NEON_BLUE)
-    
-    screen.blit(h1, h1.get_rect(center=(200, headers_y)))
-    screen.blit(h2, h2.get_rect(center=(450, headers_y)))
-    screen.blit(h3, h3.get_rect(center=(650, headers_y)))
+    headers_y = 150
+    columns = (170, 360, 510, 650)
+    for x, label in zip(columns, ("DIFFICULTY", "BEST", "AVG", "GAMES")):
+        h = text_cache.render(globals.font_md, label, NEON_BLUE)
+        screen.blit(h, h.get_rect(center=(x, headers_y)))
     
     pygame.draw.line(screen, NEON_BLUE, (50, headers_y + 30), (750, headers_y + 30), 2)
     
-    start_y = 220
-    row_height = 50
+    start_y = 210
+    row_height = 40
     
     diff_colors = {
         "EASY": NEON_GREEN,
@@ -247,38 +369,60 @@ def draw_stats(screen):
         "NIGHTMARE": NEON_RED
     }
     
+    # Queried once when the screen opens (see action_stats)
+    summary = globals.stats_summary
+    totals = summary["totals"] if summary else {}
     total_games = 0
     
     for i, diff in enumerate(Difficulty):
         name = diff.name
         data = globals.game_data.get(name, {"high_score": 0, "games_played": 0})
+        y = start_y + i * row_height
         
         c = diff_colors.get(name, WHITE)
         
-        t1 = globals.font_md.render(name, True, c)
-        screen.blit(t1, t1.get_rect(center=(200, start_y + i * row_height)))
+        t1 = text_cache.render(globals.font_md, name, c)
+        screen.blit(t1, t1.get_rect(center=(columns[0], y)))
         
         score_val = data["high_score"]
-        t2 = globals.font_md.render(f"{score_val:06d}", True, WHITE)
-        screen.blit(t2, t2.get_rect(center=(450, start_y + i * row_height)))
+        t2 = text_cache.render(globals.font_md, f"{score_val:06d}", WHITE)
+        screen.blit(t2, t2.get_rect(center=(columns[1], y)))
+        
+        avg = totals.get(name)
+        t3 = text_cache.render(globals.font_md, f"{avg['avg_score']:.1f}" if avg else "-", WHITE)
+        screen.blit(t3, t3.get_rect(center=(columns[2], y)))
         
         games_val = data["games_played"]
         total_games += games_val
-        t3 = globals.font_md.render(str(games_val), True, WHITE)
-        screen.blit(t3, t3.get_rect(center=(650, start_y + i * row_height)))
+        t4 = text_cache.render(globals.font_md, str(games_val), WHITE)
+        screen.blit(t4, t4.get_rect(center=(columns[3], y)))
 
-    footer_y = start_y + 5 * row_height + 20
-    t_total = globals.font_md.render(f"TOTAL GAMES PLAYED: {total_games}", True, NEON_YELLOW)
-    screen.blit(t_total, t_total.get_rect(center=(SCREEN_WIDTH//2, footer_y)))
+    # Best runs and trend for the selected difficulty
+    diff_name = globals.current_difficulty.name
+    top_y = start_y + 5 * row_height + 10
+    label = text_cache.render(globals.font_sm, f"TOP {diff_name} RUNS", diff_colors.get(diff_name, WHITE))
+    screen.blit(label, label.get_rect(center=(SCREEN_WIDTH//2, top_y)))
+    
+    top = summary["top"] if summary else []
+    for i, (score, wave, duration, _) in enumerate(top):
+        minutes, seconds = divmod(int(duration), 60)
+        t = text_cache.render(globals.font_sm, f"{i + 1}. {score:06d}  W{wave}  {minutes}:{seconds:02d}", WHITE)
+        screen.blit(t, t.get_rect(center=(SCREEN_WIDTH * (i + 1) // (len(top) + 1), top_y + 28)))
+    
+    footer = f"TOTAL GAMES PLAYED: {total_games}"
+    if summary and summary["trend"] is not None:
+        footer += f"   RECENT TREND: {summary['trend']:+.1f}"
+    t_total = text_cache.render(globals.font_sm, footer, NEON_YELLOW)
+    screen.blit(t_total, t_total.get_rect(center=(SCREEN_WIDTH//2, top_y + 58)))
         
     for btn in globals.stats_buttons:
         btn.draw(screen)
 
 def draw_controls(screen):
     screen.fill(BLACK)
-    for star in globals.stars: star.draw(screen)
+    globals.starfield.draw(screen)
     
-    title = globals.font_lg.render("CONTROLS", True, NEON_ORANGE)
+    title = text_cache.render(globals.font_lg, "CONTROLS", NEON_ORANGE)
     screen.blit(title, title.get_rect(center=(SCREEN_WIDTH//2, 80)))
     
     controls_list = [
@@ -293,8 +437,8 @@ def draw_controls(screen):
     row_height = 60
     
     for i, (action, key) in enumerate(controls_list):
-        act_txt = globals.font_md.render(action, True, NEON_BLUE)
-        key_txt = globals.font_md.render(key, True, WHITE)
+        act_txt = text_cache.render(globals.font_md, action, NEON_BLUE)
+        key_txt = text_cache.render(globals.font_md, key, WHITE)
         
         # Left align action, right align key relative to center
         # Or just two columns
@@ -305,30 +449,37 @@ def draw_controls(screen):
     for btn in globals.controls_buttons:
         btn.draw(screen)
 
-def draw_pause(screen):
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0,0,0,150))
-    screen.blit(overlay, (0,0))
-    
-    txt = globals.font_lg.render("PAUSED", True, WHITE)
-    screen.blit(txt, txt.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50)))
+def draw_pause(screen, draw_world):
+    if globals.frozen_state != GameState.PAUSED:
+        backdrop = new_backdrop()
+        draw_world(backdrop)
+        draw_hud(backdrop)
+        backdrop.blit(sprite_cache.get_image("overlay", 150), (0,0))
+        
+        txt = text_cache.render(globals.font_lg, "PAUSED", WHITE)
+        backdrop.blit(txt, txt.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50)))
+        freeze_backdrop(backdrop, GameState.PAUSED)
+    screen.blit(globals.frozen_backdrop, (0, 0))
     
     for btn in globals.pause_buttons:
         btn.draw(screen)
 
-def draw_game_over(screen):
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    screen.blit(overlay, (0,0))
-    
-    over_txt = globals.font_xl.render("MISSION FAILED", True, NEON_RED)
-    screen.blit(over_txt, over_txt.get_rect(center=(SCREEN_WIDTH//2, 200)))
-    
-    score_txt = globals.font_md.render(f"FINAL SCORE: {globals.score}", True, WHITE)
-    screen.blit(score_txt, score_txt.get_rect(center=(SCREEN_WIDTH//2, 300)))
-    
-    restart_txt = globals.font_md.render("PRESS R TO RETRY", True, NEON_GREEN)
-    screen.blit(restart_txt, restart_txt.get_rect(center=(SCREEN_WIDTH//2, 400)))
+def draw_game_over(screen, draw_world):
+    if globals.frozen_state != GameState.GAME_OVER:
+        backdrop = new_backdrop()
+        draw_world(backdrop)
+        backdrop.blit(sprite_cache.get_image("overlay", 180), (0,0))
+        
+        over_txt = text_cache.render(globals.font_xl, "MISSION FAILED", NEON_RED)
+        backdrop.blit(over_txt, over_txt.get_rect(center=(SCREEN_WIDTH//2, 200)))
+        
+        score_txt = text_cache.render(globals.font_md, f"FINAL SCORE: {globals.score}", WHITE)
+        backdrop.blit(score_txt, score_txt.get_rect(center=(SCREEN_WIDTH//2, 300)))
+        
+        restart_txt = text_cache.render(globals.font_md, "PRESS R TO RETRY", NEON_GREEN)
+        backdrop.blit(restart_txt, restart_txt.get_rect(center=(SCREEN_WIDTH//2, 400)))
+        freeze_backdrop(backdrop, GameState.GAME_OVER)
+    screen.blit(globals.frozen_backdrop, (0, 0))
 
     for btn in globals.game_over_buttons:
         btn.draw(screen)
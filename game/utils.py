@@ -1,5 +1,4 @@
 import math
-import random
 from . import globals
 
 def add_shake(amount):
@@ -8,7 +7,7 @@ def add_shake(amount):
 def update_shake():
     if globals.shake_intensity > 0:
         globals.shake_intensity *= 0.9
-        angle = random.uniform(0, math.pi * 2)
+        angle = globals.rng.uniform(0, math.pi * 2)
         offset = globals.shake_intensity # radius
         globals.shake_offset[0] = math.cos(angle) * offset
         globals.shake_offset[1] = math.sin(angle) * offset
@@ -17,3 +16,7 @@ def update_shake():
             globals.shake_offset = [0, 0]
     else:
         globals.shake_offset = [0, 0]
+
+def get_ticks():
+    # Simulation clock in ms. Gameplay never reads the wall clock.
+    return int(globals.sim_ticks)
@@ -0,0 +1,90 @@
+import pygame
+from .constants import VOICE_GROUPS, SOUND_VOICES, DEFAULT_SOUND_VOICE
+
+class Voice:
+    def __init__(self, channel):
+        self.channel = channel
+        self.name = None
+        self.priority = 0
+        self.started = 0
+
+class VoiceManager:
+    # Every mixer channel is reserved and split into per-category groups so
+    # a flood of one sound can never starve another category. Within a group
+    # each sound has a concurrency cap; when a group is full the oldest
+    # lowest-priority voice is stolen, or the new sound is dropped if every
+    # playing voice outranks it.
+    def __init__(self):
+        self.groups = None
+        self.volumes = {} # Last volume applied per sound name
+        self.counter = 0
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+        self.volume_skips = 0
+
+    def setup(self):
+        total = sum(VOICE_GROUPS.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+        self.groups = {}
+        index = 0
+        for group, count in VOICE_GROUPS.items():
+            self.groups[group] = [Voice(pygame.mixer.Channel(index + i)) for i in range(count)]
+            index += count
+
+    def ready(self):
+        if self.groups is None:
+            if not pygame.mixer.get_init():
+                return False
+            self.setup()
+        return True
+
+    def set_volume(self, name, sound, volume):
+        if self.volumes.get(name) == volume:
+            self.volume_skips += 1
+            return
+        sound.set_volume(volume)
+        self.volumes[name] = volume
+
+    def play(self, name, sound, volume):
+        if not self.ready():
+            return None
+        group, priority, max_voices = SOUND_VOICES.get(name, DEFAULT_SOUND_VOICE)
+        voices = self.groups[group]
+
+        playing = [v for v in voices if v.name is not None and v.channel.get_busy()]
+        same = [v for v in playing if v.name == name]
+
+        if len(same) >= max_voices:
+            target = min(same, key=lambda v: v.started)
+        else:
+            target = next((v for v in voices if not v.channel.get_busy()), None)
+            if target is None:
+                candidates = [v for v in playing if v.priority <= priority]
+                if not candidates:
+                    self.dropped += 1
+                    return None
+                target = min(candidates, key=lambda v: (v.priority, v.started))
+
+        if target.channel.get_busy():
+            target.channel.stop()
+            self.stolen += 1
+
+        self.set_volume(name, sound, volume)
+        target.channel.play(sound)
+        self.counter += 1
+        target.name = name
+        target.priority = priority
+        target.started = self.counter
+        self.played += 1
+        return target.channel
+
+    def music_channel(self):
+        # Dedicated channel for the streamed music, never stolen
+        return self.groups["music"][0].channel
+
+    def stats(self):
+        return {"played": self.played, "dropped": self.dropped, "stolen": self.stolen, "volume_skips": self.volume_skips}
+
+manager = VoiceManager()
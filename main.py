@@ -1,40 +1,98 @@
 import pygame
+import os
 import sys
 import random
 
+if __name__ == "__main__" and "--headless" in sys.argv:
+    from game import headless
+    sys.exit(headless.main())
+
+from game import startup
+
 # Initialize Pygame before importing modules that might use it
 pygame.mixer.pre_init(44100, -16, 2, 512)
 pygame.init()
 pygame.mixer.init()
+startup.timeline.mark("pygame init")
 
 # Import game packages
 from game.constants import *
 from game import globals
-from game.entities import Star
+from game.starfield import Starfield
+from game.entities import PLAYER_FRAMES
 from game import audio
+from game import music
 from game import data
 from game import core
+from game import particles
+from game import projectiles
+from game import inputs
+from game import debug
+from game.profiler import profiler
+from game import replay
+from game import renderer
+from game.pacing import pacer
+from game import timeline
 from game import ui
+startup.timeline.mark("imports")
+
+def option_value(flag):
+    # Value following a command line flag, or None if the flag has no value
+    idx = sys.argv.index(flag) + 1
+    if idx < len(sys.argv) and not sys.argv[idx].startswith("--"):
+        return sys.argv[idx]
+    return None
+
+def draw_world(screen):
+    # The world as it stands, without shake or interpolation
+    globals.starfield.draw(screen)
+    globals.all_sprites.draw(screen)
+    projectiles.enemy_bullets.draw(screen)
+    particles.system.draw(screen)
 
 def main():
     # Setup Screen
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Pacing comes first, since vsync has to be asked for when the display opens
+    pacer.load()
+    if "--pacing" in sys.argv or "--fps" in sys.argv:
+        pacer.set(option_value("--pacing") if "--pacing" in sys.argv else None,
+                  option_value("--fps") if "--fps" in sys.argv else None)
+    backend = option_value("--renderer") if "--renderer" in sys.argv else "surface"
+    scale = int(option_value("--scale") or 1) if "--scale" in sys.argv else 1
+    display = renderer.create(backend, (SCREEN_WIDTH, SCREEN_HEIGHT), "Space Shooter", scale,
+                              "--software" in sys.argv, pacer.mode == "vsync")
+    pacer.vsync_active = display.vsync
+    globals.renderer = display
+    screen = display.screen
     try:
         # Load icon
         icon_path = "game/Icon.png"
         icon = pygame.image.load(icon_path)
-        pygame.display.set_icon(icon)
+        display.set_icon(icon)
     except Exception as e:
         print(f"Warning: Could not load icon: {e}")
 
-    pygame.display.set_caption("Space Shooter")
-    clock = pygame.time.Clock()
+    startup.timeline.mark("display")
 
     # Initialization
-    globals.init_fonts()
+    # Only what the menu needs runs here; the rest goes to a background worker
+    loader = startup.BackgroundLoader()
+    font_cached, font_path = startup.cached_font_path()
+    globals.init_fonts(font_path)
+    if not font_cached:
+        # Draw with the default font until the system font scan finishes
+        loader.add("font scan", startup.resolve_font_path, globals.init_fonts)
+    startup.timeline.mark("fonts")
+    
+    if "--replay" in sys.argv:
+        # Replayed runs must not count as games played
+        globals.save_enabled = False
     data.load_game_data()
-    audio.load_all_sounds()
-    audio.play_background_music()
+    startup.timeline.mark("save data")
+    
+    # Sounds stay silent until synthesis finishes
+    loader.add("audio", audio.load_all_sounds, lambda _: audio.play_background_music())
+    loader.start()
     
     # Init UI
     ui.init_menu_buttons()
@@ -45,30 +103,59 @@ def main():
     ui.init_game_over_buttons()
     
     # Init Background
-    globals.stars = [Star() for _ in range(100)]
+    globals.starfield = Starfield()
+    
+    # Pre-render procedural sprite frames
+    PLAYER_FRAMES.build()
+    startup.timeline.mark("ui and sprites")
+    
+    if "--profile" in sys.argv:
+        # Record a CSV trace of the whole session, written on exit
+        profiler.record_to(option_value("--profile"))
+    if "--timeline" in sys.argv:
+        timeline.waves.path = option_value("--timeline")
+    if "--record" in sys.argv:
+        replay.start_recording(option_value("--record") or os.path.join(data.save_dir, "replays"))
+    if "--replay" in sys.argv:
+        try:
+            replay.start_playback(replay.Recording.load(option_value("--replay")))
+        except (OSError, ValueError) as e:
+            print(f"Cannot replay {option_value('--replay')}: {e}")
     
-    globals.last_frame_time = pygame.time.get_ticks()
+    first_frame = True
+    loading = True
+    
+    # Fixed-timestep accumulator: the sim advances in SIM_DT steps,
+    # rendering runs at whatever rate the pacing mode allows
+    accumulator = 0.0
+    pacer.tick()
     
     running = True
     while running:
-        clock.tick(60)
+        globals.frame_dt = pacer.tick()
         
         # Check global quit flag from UI actions
         if globals.should_quit:
             running = False
             
-        for event in pygame.event.get():
+        with profiler.section("events"):
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
                 
             # Global Keys
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
+                if event.key == pygame.K_F4:
+                    profiler.dump_csv()
+
                 if event.key == pygame.K_p:
                    if globals.game_state == GameState.PLAYING:
                        globals.game_state = GameState.PAUSED
                    elif globals.game_state == GameState.PAUSED:
                        globals.game_state = GameState.PLAYING
-                       globals.last_frame_time = pygame.time.get_ticks()
 
                 # Retry from Game Over
                 if event.key == pygame.K_r and globals.game_state == GameState.GAME_OVER:
@@ -102,47 +189,91 @@ def main():
             # Player Input
             elif globals.game_state == GameState.PLAYING:
                  if event.type == pygame.KEYDOWN and (event.key == pygame.K_z or event.key == pygame.K_SPACE):
-                     if globals.player:
-                        globals.player.shoot()
+                     inputs.request_fire()
+
+        music.update_intensity()
 
         # Drawing and Updates
-        screen.fill(BLACK)
+        if globals.frozen_state is not None and globals.frozen_state != globals.game_state:
+            ui.thaw_backdrop()
+        if globals.frozen_state is None:
+            with profiler.section("background"):
+                display.clear()
         
         # Shake offset
         sx, sy = int(globals.shake_offset[0]), int(globals.shake_offset[1])
+        # These screens use pygame.draw, so they need the screen surface
+        drawn_on_screen = globals.game_state in (GameState.SETTINGS, GameState.STATS, GameState.CONTROLS)
         
         if globals.game_state == GameState.MENU:
-            ui.draw_menu(screen)
+            with profiler.section("ui"):
+                ui.draw_menu(display.target)
         elif globals.game_state == GameState.SETTINGS:
-            ui.draw_settings(screen)
+            with profiler.section("ui"):
+                ui.draw_settings(screen)
         elif globals.game_state == GameState.STATS:
-            ui.draw_stats(screen)
+            with profiler.section("ui"):
+                ui.draw_stats(screen)
         elif globals.game_state == GameState.CONTROLS:
-            ui.draw_controls(screen)
+            with profiler.section("ui"):
+                ui.draw_controls(screen)
         elif globals.game_state == GameState.PLAYING:
-            # Draw Background
-            for s in globals.stars:
-                s.draw(screen)
-            
-            core.update_game_logic()
-            
-            for sprite in globals.all_sprites:
-                screen.blit(sprite.image, (sprite.rect.x + sx, sprite.rect.y + sy))
-                
-            ui.draw_hud(screen)
+            accumulator += globals.frame_dt
+            steps = 0
+            # Stop catching up once the run ends, later steps would end it again
+            while accumulator >= SIM_DT and steps < MAX_CATCHUP_STEPS and globals.game_state == GameState.PLAYING:
+                with profiler.section("update"):
+                    core.step()
+                accumulator -= SIM_DT
+                steps += 1
+            if steps == MAX_CATCHUP_STEPS:
+                # Too far behind, drop the backlog instead of spiralling
+                accumulator = min(accumulator, SIM_DT)
+            alpha = accumulator / SIM_DT
             
+            # Background, sprites and HUD go through the layered render queue
+            ui.draw_playing(display.target, (sx, sy), alpha)
+
         elif globals.game_state == GameState.PAUSED:
-            for s in globals.stars: s.draw(screen)
-            globals.all_sprites.draw(screen)
-            ui.draw_hud(screen)
-            ui.draw_pause(screen)
+            with profiler.section("ui"):
+                ui.draw_pause(display.target, draw_world)
 
         elif globals.game_state == GameState.GAME_OVER:
-            for s in globals.stars: s.draw(screen)
-            globals.all_sprites.draw(screen)
-            ui.draw_game_over(screen)
+            with profiler.section("ui"):
+                ui.draw_game_over(display.target, draw_world)
+
+        if globals.game_state != GameState.PLAYING:
+            accumulator = 0.0
+        if drawn_on_screen:
+            with profiler.section("ui"):
+                display.show_screen()
+        
+        if replay.playback is not None and (replay.playback.done or globals.game_state == GameState.MENU):
+            replay.finish_playback()
+            if globals.game_state == GameState.PLAYING:
+                globals.game_state = GameState.GAME_OVER
+
+        profiler.draw(display.target)
+        with profiler.section("flip"):
+            display.flip()
+        profiler.end_frame(globals.frame_dt)
+        
+        if first_frame:
+            first_frame = False
+            startup.timeline.mark("first frame")
+            startup.report_first_frame()
+        if loading and loader.poll():
+            loading = False
+            startup.timeline.report(f"Startup complete after {startup.timeline.elapsed_ms():.0f} ms:")
+
+    if "--debug" in sys.argv:
+        debug.print_stats()
+    if profiler.recording:
+        profiler.dump_csv()
 
-        pygame.display.flip()
+    replay.stop_recording()
+    audio.stop_background_music()
+    data.shutdown()
 
     pygame.quit()
     sys.exit()